@@ -0,0 +1,191 @@
+import argparse
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+from data import JIRA_DATE_FORMAT, find_data_file, load_export
+from metrics import DONE_STATUSES, IN_PROGRESS_STATUSES
+
+# Days a ticket may sit in its current status before it is flagged, per priority
+DEFAULT_THRESHOLDS = {
+    'Highest': 2,
+    'High': 3,
+    'Medium': 7,
+    'Low': 14,
+    'Lowest': 21
+}
+DEFAULT_THRESHOLD = 7
+
+AGE_BINS = [0, 1, 3, 7, 14, 30, np.inf]
+AGE_LABELS = ['<1d', '1-3d', '3-7d', '1-2w', '2-4w', '30d+']
+
+# Jira only stamps category changes (To Do -> In Progress -> Done). A move
+# within a category (In Progress -> In Review) keeps the old stamp, so once
+# the engine sees one it dates the move by the ticket's Updated time instead.
+STATUS_CHANGED_COLUMN = 'Status Category Changed'
+
+
+class AgingEngine:
+    """Age-in-status for every open ticket, refreshed incrementally
+
+    Each update only re-derives the entry timestamp for tickets whose Status
+    or status-change stamp differs from the previous export; ages themselves
+    are a single vectorized subtraction over the whole open backlog.
+    """
+
+    def __init__(self, done_statuses=DONE_STATUSES):
+        self.done_statuses = list(done_statuses)
+        self._lock = threading.Lock()
+        self._version = None
+        self._tickets = None
+        self._entered = None
+
+    def update(self, df, version=None):
+        """Refresh from an export; returns the number of tickets re-derived"""
+        with self._lock:
+            if version is not None and version == self._version:
+                return 0
+
+            tickets = df.drop_duplicates('Issue id', keep='last').set_index('Issue id')
+            changed_raw = (
+                tickets[STATUS_CHANGED_COLUMN] if STATUS_CHANGED_COLUMN in tickets.columns
+                else pd.Series(np.nan, index=tickets.index, dtype=object)
+            )
+
+            entered = pd.Series(pd.NaT, index=tickets.index, dtype='datetime64[ns]')
+            if self._tickets is None:
+                stale = np.ones(len(tickets), dtype=bool)
+                within = np.zeros(len(tickets), dtype=bool)
+            else:
+                previous = self._tickets.reindex(tickets.index)
+                moved = previous['Status'].notna() & previous['Status'].ne(tickets['Status'])
+                restamped = previous['Changed'].fillna('').ne(changed_raw.fillna(''))
+                stale = (moved | restamped | previous['Status'].isna()).to_numpy()
+                within = (moved & ~restamped).to_numpy()
+                entered[~stale] = self._entered.reindex(tickets.index[~stale]).to_numpy()
+
+            # Entry into the current status: category stamp (unless the status moved
+            # within its category), else last update, else creation
+            fresh = tickets[stale]
+            stamp = pd.to_datetime(changed_raw[stale], format=JIRA_DATE_FORMAT, errors='coerce')
+            stamp = stamp.mask(within[stale])
+            stamp = stamp.fillna(fresh['Updated']).fillna(fresh['Created'])
+            entered[stale] = stamp.astype('datetime64[ns]').to_numpy()
+
+            self._tickets = pd.DataFrame({
+                'Issue key': tickets['Issue key'],
+                'Summary': tickets['Summary'],
+                'Assignee': tickets['Assignee'],
+                'Priority': tickets['Priority'],
+                'Status': tickets['Status'],
+                'Changed': changed_raw
+            })
+            self._entered = entered
+            self._version = version
+            return int(stale.sum())
+
+    def ages(self, now=None, thresholds=None, default_threshold=DEFAULT_THRESHOLD, statuses=None):
+        """Open tickets with their age in status, age bucket and stale flag
+
+        `statuses` restricts to some open statuses (e.g. only In Progress / In Review).
+        """
+        if self._tickets is None:
+            return pd.DataFrame(columns=[
+                'Issue id', 'Issue key', 'Summary', 'Assignee', 'Priority', 'Status',
+                'In Status Since', 'Age Days', 'Age Bucket', 'Threshold', 'Stale'
+            ])
+
+        now = pd.Timestamp(now) if now is not None else pd.Timestamp.now()
+        thresholds = DEFAULT_THRESHOLDS if thresholds is None else thresholds
+
+        with self._lock:
+            tickets, entered = self._tickets, self._entered
+
+        open_mask = ~tickets['Status'].isin(self.done_statuses)
+        if statuses is not None:
+            open_mask &= tickets['Status'].isin(statuses)
+
+        aging = tickets.loc[open_mask].drop(columns='Changed')
+        aging['In Status Since'] = entered[open_mask]
+        aging['Age Days'] = ((now - aging['In Status Since']).dt.total_seconds() / 86400).round(1)
+        aging['Age Bucket'] = pd.cut(aging['Age Days'], AGE_BINS, labels=AGE_LABELS, right=False)
+        aging['Threshold'] = aging['Priority'].map(thresholds).fillna(default_threshold)
+        aging['Stale'] = aging['Age Days'] >= aging['Threshold']
+
+        return aging.reset_index().sort_values('Age Days', ascending=False, ignore_index=True)
+
+
+def bucket_counts(aging):
+    """Open tickets per assignee x age bucket"""
+    return (
+        aging.groupby(['Assignee', 'Age Bucket'], observed=False).size()
+        .unstack('Age Bucket', fill_value=0)
+        .reindex(columns=AGE_LABELS, fill_value=0)
+    )
+
+
+def aging_summary(aging):
+    """Per assignee / priority: open count, median and max age, stale count"""
+    summary = aging.groupby(['Assignee', 'Priority']).agg(
+        Open=('Issue key', 'count'),
+        Median_Age=('Age Days', 'median'),
+        Oldest=('Age Days', 'max'),
+        Stale=('Stale', 'sum')
+    ).reset_index()
+    summary.columns = ['Assignee', 'Priority', 'Open', 'Median Age (d)', 'Oldest (d)', 'Stale']
+    return summary.sort_values(['Stale', 'Oldest (d)'], ascending=False, ignore_index=True)
+
+
+def alert_report(aging):
+    """Stale tickets, oldest first"""
+    columns = ['Issue key', 'Summary', 'Assignee', 'Priority', 'Status', 'Age Days', 'Threshold']
+    return aging.loc[aging['Stale'], columns].reset_index(drop=True)
+
+
+def _parse_threshold(value):
+    priority, _, days = value.partition('=')
+    if not days:
+        raise argparse.ArgumentTypeError("expected PRIORITY=DAYS, e.g. High=3")
+    return priority, float(days)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report open tickets that have been in their status too long")
+    parser.add_argument("--data", default="Jira.csv", help="Jira CSV export")
+    parser.add_argument("--threshold", type=_parse_threshold, action="append", default=[],
+                        metavar="PRIORITY=DAYS", help="Override a priority's threshold (repeatable)")
+    parser.add_argument("--default-threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Threshold for priorities without one")
+    parser.add_argument("--wip-only", action="store_true", help="Only In Progress / In Review tickets")
+    parser.add_argument("--out", help="Write the alert report as CSV instead of printing it")
+    parser.add_argument("--fail-on-stale", action="store_true", help="Exit with status 1 if anything is stale")
+    args = parser.parse_args(argv)
+
+    data_file = find_data_file(args.data)
+    if data_file is None:
+        parser.error(f"Jira export not found: {args.data}")
+
+    engine = AgingEngine()
+    engine.update(load_export(data_file))
+    aging = engine.ages(
+        thresholds={**DEFAULT_THRESHOLDS, **dict(args.threshold)},
+        default_threshold=args.default_threshold,
+        statuses=IN_PROGRESS_STATUSES if args.wip_only else None
+    )
+    report = alert_report(aging)
+
+    if args.out:
+        report.to_csv(args.out, index=False)
+        print(f"{len(report)} stale of {len(aging)} open tickets written to {args.out}")
+    else:
+        print(f"{len(report)} stale of {len(aging)} open tickets")
+        if not report.empty:
+            print(report.to_string(index=False, max_colwidth=50))
+
+    return 1 if args.fail_on_stale and not report.empty else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
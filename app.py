@@ -1,9 +1,17 @@
+import os
+import re
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import numpy as np
+from datetime import datetime
+from aging import DEFAULT_THRESHOLD, DEFAULT_THRESHOLDS, AgingEngine, aging_summary, alert_report, bucket_counts
+import charts
+from charts import figure_spec
+from data import find_data_file
+import metrics
+from partitions import load_partition, project_manifest, safe_name
+from side_tables import read_side_tables, watcher_load, comment_activity
+from snapshots import DEFAULT_STORE_DIR, SnapshotStore, combine_series
+from teams import DEFAULT_MAPPING_FILE, MAX_MEMBER_OPTIONS, TeamIndex, load_team_mapping
 
 # Page Config
 st.set_page_config(
@@ -13,209 +21,106 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Premium Custom CSS
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    .stApp {
-        background: linear-gradient(135deg, #0a0a0f 0%, #1a1a2e 50%, #16213e 100%);
-        font-family: 'Inter', sans-serif;
-    }
-    
-    /* Header Styles */
-    .main-header {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        font-size: 2.8rem;
-        font-weight: 700;
-        margin-bottom: 0;
-    }
-    
-    .sub-header {
-        color: #a0aec0;
-        font-size: 1.1rem;
-        margin-top: -10px;
-    }
-    
-    /* Metric Cards */
-    .metric-container {
-        background: linear-gradient(145deg, #1e1e2f 0%, #2d2d44 100%);
-        border-radius: 16px;
-        padding: 24px;
-        border: 1px solid rgba(255,255,255,0.1);
-        box-shadow: 0 8px 32px rgba(0,0,0,0.3);
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-    }
-    
-    .metric-container:hover {
-        transform: translateY(-4px);
-        box-shadow: 0 12px 40px rgba(102, 126, 234, 0.2);
-    }
-    
-    .metric-value {
-        font-size: 2.5rem;
-        font-weight: 700;
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-    }
-    
-    .metric-label {
-        color: #a0aec0;
-        font-size: 0.9rem;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        margin-bottom: 8px;
-    }
-    
-    .metric-delta {
-        font-size: 0.85rem;
-        padding: 4px 12px;
-        border-radius: 20px;
-        display: inline-block;
-        margin-top: 8px;
-    }
-    
-    .delta-positive {
-        background: rgba(72, 187, 120, 0.2);
-        color: #48bb78;
-    }
-    
-    .delta-negative {
-        background: rgba(245, 101, 101, 0.2);
-        color: #f56565;
-    }
-    
-    .delta-neutral {
-        background: rgba(160, 174, 192, 0.2);
-        color: #a0aec0;
-    }
-    
-    /* Section Headers */
-    .section-header {
-        color: #e2e8f0;
-        font-size: 1.4rem;
-        font-weight: 600;
-        margin: 30px 0 20px 0;
-        padding-bottom: 10px;
-        border-bottom: 2px solid rgba(102, 126, 234, 0.3);
-    }
-    
-    /* Cards */
-    .glass-card {
-        background: rgba(255,255,255,0.03);
-        backdrop-filter: blur(10px);
-        border-radius: 16px;
-        border: 1px solid rgba(255,255,255,0.08);
-        padding: 20px;
-    }
-    
-    /* Leaderboard */
-    .leaderboard-item {
-        display: flex;
-        align-items: center;
-        padding: 12px 16px;
-        margin: 8px 0;
-        background: rgba(255,255,255,0.03);
-        border-radius: 12px;
-        border-left: 4px solid;
-        transition: all 0.3s ease;
-    }
-    
-    .leaderboard-item:hover {
-        background: rgba(255,255,255,0.06);
-        transform: translateX(4px);
-    }
-    
-    .rank-1 { border-left-color: #ffd700; }
-    .rank-2 { border-left-color: #c0c0c0; }
-    .rank-3 { border-left-color: #cd7f32; }
-    .rank-other { border-left-color: #667eea; }
-    
-    /* Sidebar */
-    .css-1d391kg {
-        background: linear-gradient(180deg, #1a1a2e 0%, #16213e 100%);
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    
-    /* Tab styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-        background: rgba(255,255,255,0.03);
-        padding: 8px;
-        border-radius: 12px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background: transparent;
-        border-radius: 8px;
-        color: #a0aec0;
-        padding: 10px 20px;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        color: white;
-    }
-    
-    /* Expander */
-    .streamlit-expanderHeader {
-        background: rgba(255,255,255,0.03);
-        border-radius: 12px;
-    }
-    
-    /* Data table */
-    .dataframe {
-        background: rgba(255,255,255,0.02) !important;
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+# Cache bounds: entries for superseded export / partition versions are evicted
+# instead of accumulating with every refresh
+MAX_CACHED_EXPORTS = 2
+MAX_CACHED_PROJECTS = 16
+MAX_CACHED_TEAM_INDEXES = 8
+
+
+@st.cache_resource
+def load_css(path=os.path.join(STATIC_DIR, "style.css")):
+    """Read and minify the dashboard stylesheet (once per server process)"""
+    with open(path, encoding="utf-8") as f:
+        css = f.read()
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    return re.sub(r'\s+', ' ', css).strip()
+
+
+# Premium Custom CSS (read from static/ once; Streamlit needs it re-emitted every run)
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
+
+
+@st.cache_data(max_entries=MAX_CACHED_EXPORTS)
+def load_manifest(path, version):
+    """Project partitions of the export (re-split only when the export changes)"""
+    path = find_data_file(path)
+    if path is None:
+        return None
+    return project_manifest(path)
+
+
+@st.cache_data(max_entries=MAX_CACHED_PROJECTS)
+def load_project(project_key, partition_version):
+    """Load one project's tickets; cached per project and partition version"""
+    return load_partition(project_key)
+
+
+def load_data(partitions):
+    """Load and preprocess Jira data for the selected (project, version) partitions"""
+    frames = [load_project(key, version) for key, version in partitions]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+@st.cache_data(max_entries=MAX_CACHED_EXPORTS)
+def load_side_tables(path, version):
+    """Load normalized watcher / comment tables (only when a view needs them)"""
+    path = find_data_file(path)
+    if path is None:
+        return None
+    return read_side_tables(path)
+
+
+@st.cache_data(max_entries=MAX_CACHED_PROJECTS)
+def load_history(path, version, project_key, partition_version, status_groups, done_statuses):
+    """Record a project's current tickets in its snapshot store and return trend series
+
+    Keyed on the export version so a new export is recorded on the next run.
+    """
+    export_path = find_data_file(path)
+    if export_path is None:
+        return None
+    
+    # One snapshot per export day (taken from the file's modification time)
+    export_day = datetime.fromtimestamp(os.path.getmtime(export_path)).date()
+    store = SnapshotStore(os.path.join(DEFAULT_STORE_DIR, safe_name(project_key)))
+    try:
+        store.record(load_project(project_key, partition_version), export_day)
+    except ValueError:
+        pass  # Older export than the latest snapshot: show history as recorded
+    
+    return {
+        'backlog': store.backlog_series(status_groups),
+        'open_load': store.open_load_series(done_statuses),
+        'snapshots': len(store.days())
     }
-</style>
-""", unsafe_allow_html=True)
 
 
-@st.cache_data
-def load_data(path):
-    """Load and preprocess Jira data"""
-    import os
-    paths_to_try = [path, "Jira.csv", "../Jira.csv"]
-    
-    for p in paths_to_try:
-        if os.path.exists(p):
-            path = p
-            break
-    else:
-        st.error("❌ Jira.csv not found!")
-        return pd.DataFrame()
-    
-    df = pd.read_csv(path)
-    
-    # Parse dates
-    date_cols = ['Created', 'Updated', 'Resolved']
-    for col in date_cols:
-        if col in df.columns:
-            df[col] = pd.to_datetime(df[col], format='%d/%b/%y %I:%M %p', errors='coerce')
-    
-    # Clean data
-    df['Assignee'] = df['Assignee'].fillna('Unassigned')
-    df['Status'] = df['Status'].fillna('Unknown')
-    df['Priority'] = df['Priority'].fillna('Medium')
-    df['Issue Type'] = df['Issue Type'].fillna('Task')
-    df['Reporter'] = df['Reporter'].fillna('Unknown')
-    
-    # Calculate resolution time (in days)
-    if 'Created' in df.columns and 'Resolved' in df.columns:
-        df['Resolution Days'] = (df['Resolved'] - df['Created']).dt.days
-    
-    # Extract week for trend analysis
-    if 'Created' in df.columns:
-        df['Created Week'] = df['Created'].dt.isocalendar().week
-        df['Created Month'] = df['Created'].dt.month_name()
-    
-    return df
+def data_version(path):
+    """(mtime, size) of the export, used to tell when it has changed"""
+    path = find_data_file(path)
+    if path is None:
+        return None
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+@st.cache_resource(max_entries=MAX_CACHED_PROJECTS)
+def load_aging_engine(project_key):
+    """Per-project aging engine shared across sessions; refreshed incrementally"""
+    return AgingEngine(metrics.DONE_STATUSES)
+
+
+@st.cache_resource(max_entries=MAX_CACHED_TEAM_INDEXES)
+def load_team_index(partitions, mapping_path, mapping_mtime):
+    """Build the team -> member / row index once per project set and mapping file
+
+    `partitions` carries each project's content version, so a changed project
+    gets a fresh index while other project sets keep theirs.
+    """
+    return TeamIndex(load_data(partitions), load_team_mapping(mapping_path))
 
 
 def create_metric_card(label, value, delta=None, delta_type="neutral"):
@@ -234,13 +139,7 @@ def create_metric_card(label, value, delta=None, delta_type="neutral"):
 
 def render_leaderboard(df, done_statuses):
     """Render team leaderboard"""
-    leaderboard = df.groupby('Assignee').agg({
-        'Issue key': 'count',
-        'Status': lambda x: (x.isin(done_statuses)).sum()
-    }).reset_index()
-    leaderboard.columns = ['Assignee', 'Total', 'Completed']
-    leaderboard['Efficiency'] = (leaderboard['Completed'] / leaderboard['Total'] * 100).round(1)
-    leaderboard = leaderboard.sort_values('Completed', ascending=False)
+    leaderboard = metrics.leaderboard(df, done_statuses)
     
     st.markdown("### 🏆 Team Leaderboard")
     
@@ -265,31 +164,74 @@ def main():
     st.markdown('<h1 class="main-header">🚀 Team Leads Dashboard</h1>', unsafe_allow_html=True)
     st.markdown('<p class="sub-header">Real-time performance analytics & insights for your team</p>', unsafe_allow_html=True)
     
-    # Load Data
-    df = load_data("../Jira.csv")
+    # Load Data: only the partitions of the selected projects
+    export_version = data_version("../Jira.csv")
+    manifest = load_manifest("../Jira.csv", export_version)
+    
+    if manifest is None:
+        st.error("❌ Jira.csv not found!")
+        return
+    
+    project_names = dict(zip(manifest['Project key'], manifest['Project name']))
+    project_versions = dict(zip(manifest['Project key'], manifest['Version']))
+    
+    with st.sidebar:
+        st.markdown("## 🎛️ Filters")
+        st.markdown("---")
+        
+        # Project filter
+        project_keys = list(project_names)
+        selected_projects = st.multiselect(
+            "📁 Projects",
+            project_keys,
+            default=project_keys[:1],
+            format_func=lambda key: f"{key} · {project_names[key]}",
+            help="Only the selected projects' data is loaded"
+        )
+    
+    partitions = tuple((key, project_versions[key]) for key in selected_projects)
+    df = load_data(partitions)
     
     if df.empty:
-        st.error("No data available. Please check your Jira.csv file.")
+        st.error("No data available. Please select a project or check your Jira.csv file.")
         return
     
     # Status categories
-    done_statuses = ['Done', 'Resolved', 'Closed', 'Completed']
-    in_progress_statuses = ['In Progress', 'In Review']
-    todo_statuses = ['To Do', 'Idea', 'Open']
+    done_statuses = metrics.DONE_STATUSES
+    in_progress_statuses = metrics.IN_PROGRESS_STATUSES
+    todo_statuses = metrics.TODO_STATUSES
+    status_groups = metrics.status_groups(done_statuses, in_progress_statuses, todo_statuses)
     
     # Sidebar Filters
     with st.sidebar:
-        st.markdown("## 🎛️ Filters")
-        st.markdown("---")
+        # Team filter: drill down one level of the hierarchy at a time
+        mapping_mtime = os.path.getmtime(DEFAULT_MAPPING_FILE) if os.path.exists(DEFAULT_MAPPING_FILE) else None
+        team_index = load_team_index(partitions, DEFAULT_MAPPING_FILE, mapping_mtime)
         
-        # Team member filter
-        assignees = sorted(df['Assignee'].unique().tolist())
-        selected_assignees = st.multiselect(
+        team_path = ()
+        while team_index.children(team_path):
+            team = st.selectbox(
+                "🏢 Team" if not team_path else f"↳ {team_path[-1]}",
+                ["All"] + team_index.children(team_path),
+                key=f"team_{len(team_path)}"
+            )
+            if team == "All":
+                break
+            team_path += (team,)
+        
+        # Team member filter (empty = everyone in the selected team)
+        assignees = team_index.members(team_path, MAX_MEMBER_OPTIONS)
+        member_filter = st.multiselect(
             "👥 Team Members",
             assignees,
-            default=assignees,
+            default=[],
+            placeholder="All team members",
             help="Filter by specific team members"
         )
+        member_count = team_index.member_count(team_path)
+        if member_count > len(assignees):
+            st.caption(f"Showing the {len(assignees)} busiest of {member_count} members; narrow the team to list everyone.")
+        selected_assignees = member_filter or team_index.members(team_path)
         
         # Status filter with colored chips
         statuses = sorted(df['Status'].unique().tolist())
@@ -330,20 +272,18 @@ def main():
             st.info("Export functionality would be available here")
         
         if st.button("🔄 Refresh Data", width="stretch"):
-            st.cache_data.clear()
+            # Only the selected projects' caches are dropped; other projects stay warm
+            load_manifest.clear()
+            for key, version in partitions:
+                load_project.clear(key, version)
+                load_history.clear("../Jira.csv", export_version, key, version, status_groups, done_statuses)
+            load_team_index.clear(partitions, DEFAULT_MAPPING_FILE, mapping_mtime)
             st.rerun()
     
     # Apply filters
-    mask = (
-        df['Assignee'].isin(selected_assignees) & 
-        df['Status'].isin(selected_statuses) &
-        df['Priority'].isin(selected_priorities)
+    mask = metrics.filter_mask(
+        df, team_index, team_path, member_filter, selected_statuses, selected_priorities, date_range
     )
-    
-    if date_range and len(date_range) == 2:
-        start_date, end_date = date_range
-        mask &= (df['Created'].dt.date >= start_date) & (df['Created'].dt.date <= end_date)
-    
     filtered_df = df[mask]
     
     if filtered_df.empty:
@@ -351,15 +291,13 @@ def main():
         return
     
     # === KPI Section ===
-    total_tickets = len(filtered_df)
-    completed = len(filtered_df[filtered_df['Status'].isin(done_statuses)])
-    in_progress = len(filtered_df[filtered_df['Status'].isin(in_progress_statuses)])
-    todo = len(filtered_df[filtered_df['Status'].isin(todo_statuses)])
-    completion_rate = (completed / total_tickets * 100) if total_tickets > 0 else 0
-    
-    # Average resolution time
-    resolved_df = filtered_df[filtered_df['Resolution Days'].notna()]
-    avg_resolution = resolved_df['Resolution Days'].mean() if not resolved_df.empty else 0
+    kpi = metrics.kpis(filtered_df, done_statuses, in_progress_statuses, todo_statuses)
+    total_tickets = kpi['total']
+    completed = kpi['completed']
+    in_progress = kpi['in_progress']
+    todo = kpi['todo']
+    completion_rate = kpi['completion_rate']
+    avg_resolution = kpi['avg_resolution']
     
     # KPI Cards
     col1, col2, col3, col4, col5 = st.columns(5)
@@ -407,10 +345,11 @@ def main():
     st.markdown("<br>", unsafe_allow_html=True)
     
     # === Tabs for Different Views ===
-    tab1, tab2, tab3, tab4 = st.tabs([
+    tab1, tab2, tab3, tab_aging, tab4 = st.tabs([
         "📊 Overview", 
         "👤 Individual Performance", 
         "📈 Trends & Analytics",
+        "⏳ Aging WIP",
         "📋 Detailed View"
     ])
     
@@ -421,45 +360,9 @@ def main():
         with col_left:
             st.markdown('<div class="section-header">📊 Workload Distribution</div>', unsafe_allow_html=True)
             
-            workload = filtered_df.groupby('Assignee').agg({
-                'Issue key': 'count',
-                'Status': lambda x: (x.isin(done_statuses)).sum()
-            }).reset_index()
-            workload.columns = ['Assignee', 'Total', 'Completed']
-            workload = workload.sort_values('Total', ascending=True)
+            workload = metrics.workload(filtered_df, done_statuses)
             
-            fig_workload = go.Figure()
-            fig_workload.add_trace(go.Bar(
-                name='Completed',
-                y=workload['Assignee'],
-                x=workload['Completed'],
-                orientation='h',
-                marker_color='#48bb78',
-                text=workload['Completed'],
-                textposition='inside'
-            ))
-            fig_workload.add_trace(go.Bar(
-                name='Remaining',
-                y=workload['Assignee'],
-                x=workload['Total'] - workload['Completed'],
-                orientation='h',
-                marker_color='#667eea',
-                text=workload['Total'] - workload['Completed'],
-                textposition='inside'
-            ))
-            
-            fig_workload.update_layout(
-                barmode='stack',
-                height=400,
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#a0aec0'),
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-                margin=dict(l=0, r=0, t=30, b=0),
-                xaxis=dict(showgrid=True, gridcolor='rgba(255,255,255,0.05)'),
-                yaxis=dict(showgrid=False)
-            )
-            st.plotly_chart(fig_workload, width="stretch")
+            st.plotly_chart(figure_spec(charts.workload_figure, workload), width="stretch")
         
         with col_right:
             render_leaderboard(filtered_df, done_statuses)
@@ -469,82 +372,21 @@ def main():
         
         with col1:
             st.markdown('<div class="section-header">📌 Status Distribution</div>', unsafe_allow_html=True)
-            status_dist = filtered_df['Status'].value_counts().reset_index()
-            status_dist.columns = ['Status', 'Count']
-            
-            colors = ['#48bb78', '#667eea', '#f6ad55', '#fc8181', '#b794f4', '#68d391']
+            status_dist = metrics.distribution(filtered_df, 'Status')
             
-            fig_status = px.pie(
-                status_dist, 
-                values='Count', 
-                names='Status',
-                hole=0.5,
-                color_discrete_sequence=colors
-            )
-            fig_status.update_layout(
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#a0aec0'),
-                legend=dict(orientation="h", yanchor="bottom", y=-0.3),
-                margin=dict(l=20, r=20, t=20, b=60),
-                height=300
-            )
-            fig_status.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig_status, width="stretch")
+            st.plotly_chart(figure_spec(charts.status_figure, status_dist), width="stretch")
         
         with col2:
             st.markdown('<div class="section-header">⚡ Priority Breakdown</div>', unsafe_allow_html=True)
-            priority_dist = filtered_df['Priority'].value_counts().reset_index()
-            priority_dist.columns = ['Priority', 'Count']
+            priority_dist = metrics.distribution(filtered_df, 'Priority')
             
-            priority_colors = {
-                'Highest': '#fc8181',
-                'High': '#f6ad55',
-                'Medium': '#68d391',
-                'Low': '#4fd1c5',
-                'Lowest': '#667eea'
-            }
-            
-            fig_priority = px.bar(
-                priority_dist,
-                x='Priority',
-                y='Count',
-                color='Priority',
-                color_discrete_map=priority_colors,
-                text='Count'
-            )
-            fig_priority.update_layout(
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#a0aec0'),
-                showlegend=False,
-                margin=dict(l=0, r=0, t=20, b=0),
-                height=300,
-                xaxis=dict(showgrid=False),
-                yaxis=dict(showgrid=True, gridcolor='rgba(255,255,255,0.05)')
-            )
-            fig_priority.update_traces(textposition='outside')
-            st.plotly_chart(fig_priority, width="stretch")
+            st.plotly_chart(figure_spec(charts.priority_figure, priority_dist), width="stretch")
         
         with col3:
             st.markdown('<div class="section-header">🏷️ Issue Types</div>', unsafe_allow_html=True)
-            type_dist = filtered_df['Issue Type'].value_counts().reset_index()
-            type_dist.columns = ['Type', 'Count']
+            type_dist = metrics.distribution(filtered_df, 'Issue Type', 'Type')
             
-            fig_type = px.pie(
-                type_dist,
-                values='Count',
-                names='Type',
-                hole=0.5,
-                color_discrete_sequence=['#667eea', '#b794f4', '#f6ad55', '#fc8181']
-            )
-            fig_type.update_layout(
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#a0aec0'),
-                legend=dict(orientation="h", yanchor="bottom", y=-0.3),
-                margin=dict(l=20, r=20, t=20, b=60),
-                height=300
-            )
-            st.plotly_chart(fig_type, width="stretch")
+            st.plotly_chart(figure_spec(charts.issue_type_figure, type_dist), width="stretch")
     
     # === TAB 2: Individual Performance ===
     with tab2:
@@ -571,14 +413,12 @@ def main():
         person_df = df[df['Assignee'] == target_person]
         
         if not person_df.empty:
-            p_total = len(person_df)
-            p_done = len(person_df[person_df['Status'].isin(done_statuses)])
-            p_progress = len(person_df[person_df['Status'].isin(in_progress_statuses)])
-            p_efficiency = (p_done / p_total * 100) if p_total > 0 else 0
-            
-            # Avg resolution for person
-            p_resolved = person_df[person_df['Resolution Days'].notna()]
-            p_avg_resolution = p_resolved['Resolution Days'].mean() if not p_resolved.empty else 0
+            summary = metrics.person_summary(person_df, done_statuses, in_progress_statuses)
+            p_total = summary['total']
+            p_done = summary['done']
+            p_progress = summary['in_progress']
+            p_efficiency = summary['efficiency']
+            p_avg_resolution = summary['avg_resolution']
             
             # Person metrics
             st.markdown(f"### 📊 {target_person}'s Performance")
@@ -595,8 +435,7 @@ def main():
                 st.metric("Avg Resolution", f"{p_avg_resolution:.1f} days" if p_avg_resolution > 0 else "N/A")
             with m5:
                 # Calculate rank
-                completed_counts = df[df['Status'].isin(done_statuses)].groupby('Assignee').size().sort_values(ascending=False)
-                rank = list(completed_counts.index).index(target_person) + 1 if target_person in completed_counts.index else "N/A"
+                rank = metrics.team_rank(df, target_person, done_statuses)
                 st.metric("Team Rank", f"#{rank}")
             
             # Person's charts
@@ -604,48 +443,16 @@ def main():
             
             with col_left:
                 st.markdown("#### 📈 Status Breakdown")
-                p_status = person_df['Status'].value_counts().reset_index()
-                p_status.columns = ['Status', 'Count']
+                p_status = metrics.distribution(person_df, 'Status')
                 
-                fig_p_status = px.bar(
-                    p_status,
-                    x='Status',
-                    y='Count',
-                    color='Status',
-                    color_discrete_sequence=['#48bb78', '#667eea', '#f6ad55', '#fc8181', '#b794f4']
-                )
-                fig_p_status.update_layout(
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='#a0aec0'),
-                    showlegend=False,
-                    height=300,
-                    margin=dict(l=0, r=0, t=10, b=0)
-                )
-                st.plotly_chart(fig_p_status, width="stretch")
+                st.plotly_chart(figure_spec(charts.person_status_figure, p_status), width="stretch")
             
             with col_right:
                 st.markdown("#### ⏱️ Activity Timeline")
                 if 'Created' in person_df.columns:
-                    p_timeline = person_df.groupby(person_df['Created'].dt.date).size().reset_index(name='Count')
-                    p_timeline.columns = ['Date', 'Count']
+                    p_timeline = metrics.person_timeline(person_df)
                     
-                    fig_timeline = px.area(
-                        p_timeline,
-                        x='Date',
-                        y='Count',
-                        color_discrete_sequence=['#667eea']
-                    )
-                    fig_timeline.update_layout(
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        font=dict(color='#a0aec0'),
-                        height=300,
-                        margin=dict(l=0, r=0, t=10, b=0),
-                        xaxis=dict(showgrid=False),
-                        yaxis=dict(showgrid=True, gridcolor='rgba(255,255,255,0.05)')
-                    )
-                    st.plotly_chart(fig_timeline, width="stretch")
+                    st.plotly_chart(figure_spec(charts.timeline_figure, p_timeline), width="stretch")
             
             # Recent tickets
             st.markdown("#### 📋 Recent Tickets")
@@ -666,9 +473,10 @@ def main():
                 compare_df = df[df['Assignee'] == compare_person]
                 
                 if not compare_df.empty:
-                    c_total = len(compare_df)
-                    c_done = len(compare_df[compare_df['Status'].isin(done_statuses)])
-                    c_efficiency = (c_done / c_total * 100) if c_total > 0 else 0
+                    c_summary = metrics.person_summary(compare_df, done_statuses, in_progress_statuses)
+                    c_total = c_summary['total']
+                    c_done = c_summary['done']
+                    c_efficiency = c_summary['efficiency']
                     
                     comparison_data = pd.DataFrame({
                         'Metric': ['Total Tickets', 'Completed', 'Efficiency %'],
@@ -676,28 +484,33 @@ def main():
                         compare_person: [c_total, c_done, round(c_efficiency, 1)]
                     })
                     
-                    fig_compare = go.Figure()
-                    fig_compare.add_trace(go.Bar(
-                        name=target_person,
-                        x=comparison_data['Metric'],
-                        y=comparison_data[target_person],
-                        marker_color='#667eea'
-                    ))
-                    fig_compare.add_trace(go.Bar(
-                        name=compare_person,
-                        x=comparison_data['Metric'],
-                        y=comparison_data[compare_person],
-                        marker_color='#b794f4'
-                    ))
-                    fig_compare.update_layout(
-                        barmode='group',
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        font=dict(color='#a0aec0'),
-                        height=300,
-                        legend=dict(orientation="h", yanchor="bottom", y=1.02)
+                    st.plotly_chart(figure_spec(charts.comparison_figure, comparison_data), width="stretch")
+        
+        # Collaboration metrics (side tables are parsed on demand)
+        st.markdown("---")
+        if st.toggle("🤝 Show collaboration metrics", help="Watcher load and comment activity per assignee"):
+            side = load_side_tables("../Jira.csv", export_version)
+            
+            if side is None:
+                st.info("No watcher or comment data available")
+            else:
+                col_watch, col_comment = st.columns(2)
+                
+                with col_watch:
+                    st.markdown("#### 👀 Watcher Load")
+                    st.dataframe(
+                        watcher_load(side, filtered_df).sort_values('Watchers', ascending=False),
+                        width="stretch",
+                        hide_index=True
+                    )
+                
+                with col_comment:
+                    st.markdown("#### 💬 Comment Activity")
+                    st.dataframe(
+                        comment_activity(side, filtered_df).sort_values('Comments Received', ascending=False),
+                        width="stretch",
+                        hide_index=True
                     )
-                    st.plotly_chart(fig_compare, width="stretch")
     
     # === TAB 3: Trends & Analytics ===
     with tab3:
@@ -708,115 +521,119 @@ def main():
         with col1:
             st.markdown("#### 📅 Weekly Activity Trend")
             if 'Created' in filtered_df.columns:
-                weekly = filtered_df.groupby(filtered_df['Created'].dt.isocalendar().week).agg({
-                    'Issue key': 'count',
-                    'Status': lambda x: (x.isin(done_statuses)).sum()
-                }).reset_index()
-                weekly.columns = ['Week', 'Created', 'Resolved']
+                weekly = metrics.weekly_trend(filtered_df, done_statuses)
                 
-                fig_weekly = go.Figure()
-                fig_weekly.add_trace(go.Scatter(
-                    x=weekly['Week'],
-                    y=weekly['Created'],
-                    mode='lines+markers',
-                    name='Created',
-                    line=dict(color='#667eea', width=3),
-                    marker=dict(size=8)
-                ))
-                fig_weekly.add_trace(go.Scatter(
-                    x=weekly['Week'],
-                    y=weekly['Resolved'],
-                    mode='lines+markers',
-                    name='Resolved',
-                    line=dict(color='#48bb78', width=3),
-                    marker=dict(size=8)
-                ))
-                fig_weekly.update_layout(
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='#a0aec0'),
-                    height=350,
-                    xaxis=dict(title='Week Number', showgrid=False),
-                    yaxis=dict(showgrid=True, gridcolor='rgba(255,255,255,0.05)'),
-                    legend=dict(orientation="h", yanchor="bottom", y=1.02)
-                )
-                st.plotly_chart(fig_weekly, width="stretch")
+                st.plotly_chart(figure_spec(charts.weekly_figure, weekly), width="stretch")
         
         with col2:
             st.markdown("#### ⏱️ Resolution Time Distribution")
             if 'Resolution Days' in filtered_df.columns:
-                resolution_data = filtered_df[filtered_df['Resolution Days'].notna()]['Resolution Days']
+                resolution_data = metrics.resolution_days(filtered_df)
                 
                 if not resolution_data.empty:
-                    fig_resolution = px.histogram(
-                        resolution_data,
-                        nbins=20,
-                        color_discrete_sequence=['#667eea']
-                    )
-                    fig_resolution.update_layout(
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        font=dict(color='#a0aec0'),
-                        height=350,
-                        xaxis=dict(title='Days to Resolve', showgrid=False),
-                        yaxis=dict(title='Count', showgrid=True, gridcolor='rgba(255,255,255,0.05)'),
-                        showlegend=False
-                    )
-                    st.plotly_chart(fig_resolution, width="stretch")
+                    st.plotly_chart(figure_spec(charts.resolution_figure, resolution_data), width="stretch")
                 else:
                     st.info("No resolution time data available")
         
         # Heatmap
         st.markdown("#### 🗓️ Activity Heatmap by Day")
         if 'Created' in filtered_df.columns:
-            heatmap_data = filtered_df.copy()
-            heatmap_data['DayOfWeek'] = heatmap_data['Created'].dt.day_name()
-            heatmap_data['Week'] = heatmap_data['Created'].dt.isocalendar().week
+            pivot_table = metrics.activity_heatmap(filtered_df)
             
-            pivot = heatmap_data.groupby(['DayOfWeek', 'Week']).size().reset_index(name='Count')
-            pivot_table = pivot.pivot(index='DayOfWeek', columns='Week', values='Count').fillna(0)
+            st.plotly_chart(figure_spec(charts.heatmap_figure, pivot_table), width="stretch")
+        
+        # Snapshot history
+        st.markdown("#### 📉 Backlog Over Time")
+        histories = [
+            load_history("../Jira.csv", export_version, key, version, status_groups, done_statuses)
+            for key, version in partitions
+        ]
+        histories = [h for h in histories if h is not None]
+        history = {
+            'backlog': combine_series([h['backlog'] for h in histories]),
+            'open_load': combine_series([h['open_load'] for h in histories]),
+            'snapshots': max((h['snapshots'] for h in histories), default=0)
+        }
+        
+        if history['snapshots'] < 2:
+            st.info("History builds up as new exports are loaded — check back after the next data refresh")
+        else:
+            col_backlog, col_load = st.columns(2)
             
-            # Reorder days
-            days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            pivot_table = pivot_table.reindex([d for d in days_order if d in pivot_table.index])
+            with col_backlog:
+                st.plotly_chart(figure_spec(charts.backlog_figure, history['backlog']), width="stretch")
             
-            fig_heatmap = px.imshow(
-                pivot_table,
-                color_continuous_scale='Viridis',
-                aspect='auto'
-            )
-            fig_heatmap.update_layout(
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#a0aec0'),
-                height=300,
-                xaxis=dict(title='Week Number'),
-                yaxis=dict(title='')
-            )
-            st.plotly_chart(fig_heatmap, width="stretch")
+            with col_load:
+                open_load = history['open_load']
+                open_load = open_load[[c for c in open_load.columns if c in selected_assignees]]
+                st.plotly_chart(figure_spec(charts.open_load_figure, open_load), width="stretch")
         
         # Reporter Analysis
         st.markdown("#### 👤 Reporter Analysis (Who Creates Most Tickets)")
-        reporter_dist = filtered_df['Reporter'].value_counts().head(10).reset_index()
-        reporter_dist.columns = ['Reporter', 'Count']
-        
-        fig_reporter = px.bar(
-            reporter_dist,
-            x='Count',
-            y='Reporter',
-            orientation='h',
-            color='Count',
-            color_continuous_scale='Viridis'
-        )
-        fig_reporter.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#a0aec0'),
-            height=350,
-            showlegend=False,
-            xaxis=dict(showgrid=True, gridcolor='rgba(255,255,255,0.05)'),
-            yaxis=dict(showgrid=False)
-        )
-        st.plotly_chart(fig_reporter, width="stretch")
+        reporter_dist = metrics.top_reporters(filtered_df)
+        
+        st.plotly_chart(figure_spec(charts.reporter_figure, reporter_dist), width="stretch")
+    
+    # === TAB: Aging WIP ===
+    with tab_aging:
+        st.markdown('<div class="section-header">⏳ Aging Work In Progress</div>', unsafe_allow_html=True)
+        
+        col_scope, col_default = st.columns([2, 1])
+        
+        with col_scope:
+            wip_only = st.toggle("Only In Progress / In Review", value=True)
+        
+        with col_default:
+            default_threshold = st.number_input("Default threshold (days)", min_value=1, value=DEFAULT_THRESHOLD)
+        
+        with st.expander("⚙️ Stale thresholds by priority (days)"):
+            thresholds = {}
+            for col, (priority, days) in zip(st.columns(len(DEFAULT_THRESHOLDS)), DEFAULT_THRESHOLDS.items()):
+                with col:
+                    thresholds[priority] = st.number_input(priority, min_value=1, value=days, key=f"threshold_{priority}")
+        
+        project_ages = []
+        for key, version in partitions:
+            aging_engine = load_aging_engine(key)
+            aging_engine.update(load_project(key, version), version)
+            project_ages.append(aging_engine.ages(
+                thresholds=thresholds,
+                default_threshold=default_threshold,
+                statuses=in_progress_statuses if wip_only else None
+            ))
+        wip = pd.concat(project_ages, ignore_index=True).sort_values('Age Days', ascending=False)
+        wip = wip[wip['Issue id'].isin(filtered_df['Issue id'])]
+        
+        if wip.empty:
+            st.info("No open tickets match the selected filters")
+        else:
+            stale = alert_report(wip)
+            
+            a1, a2, a3, a4 = st.columns(4)
+            with a1:
+                st.metric("Open Tickets", len(wip))
+            with a2:
+                st.metric("Stale", len(stale), delta=f"{len(stale) / len(wip) * 100:.0f}% over threshold", delta_color="inverse")
+            with a3:
+                st.metric("Median Age", f"{wip['Age Days'].median():.1f} days")
+            with a4:
+                st.metric("Oldest", f"{wip['Age Days'].max():.1f} days")
+            
+            col_left, col_right = st.columns([3, 2])
+            
+            with col_left:
+                st.markdown("#### 📊 Age in Status by Assignee")
+                st.plotly_chart(figure_spec(charts.aging_figure, bucket_counts(wip)), width="stretch")
+            
+            with col_right:
+                st.markdown("#### 🧮 By Assignee & Priority")
+                st.dataframe(aging_summary(wip), width="stretch", hide_index=True, height=350)
+            
+            st.markdown("#### 🚨 Stale Tickets")
+            if stale.empty:
+                st.success("Nothing is over its threshold 🎉")
+            else:
+                st.dataframe(stale, width="stretch", hide_index=True)
     
     # === TAB 4: Detailed View ===
     with tab4:
@@ -0,0 +1,115 @@
+import argparse
+import csv
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Each snippet runs in a fresh interpreter and prints its own elapsed seconds
+LOAD_CSV = """
+import time; from data import read_export; t0 = time.perf_counter()
+read_export("Jira.csv")
+print(time.perf_counter() - t0)
+"""
+
+LOAD_PRECOMPILED = """
+import time; from data import load_export; t0 = time.perf_counter()
+load_export("Jira.csv")
+print(time.perf_counter() - t0)
+"""
+
+FIRST_RUN = """
+import time; t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+AppTest.from_file({app!r}, default_timeout=600).run()
+print(time.perf_counter() - t0)
+"""
+
+
+def scaled_export(source, target, scale):
+    """Write a copy of the export with every ticket repeated `scale` times"""
+    with open(source, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = list(reader)
+
+    key_col, id_col = header.index('Issue key'), header.index('Issue id')
+    with open(target, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for copy in range(scale):
+            for row in rows:
+                row = list(row)
+                row[key_col] = f"{row[key_col]}-{copy}"
+                row[id_col] = str(int(row[id_col]) + copy * 1_000_000)
+                writer.writerow(row)
+
+
+def measure(snippet, cwd, runs, reset=()):
+    """Median seconds reported by `snippet` over `runs` fresh interpreters
+
+    Directories in `reset` (relative to `cwd`) are deleted before every run, so
+    files written by one run (partitions, snapshots) can't warm the next.
+    """
+    env = dict(os.environ, PYTHONPATH=APP_DIR, PYTHONWARNINGS="ignore")
+    times = []
+    for _ in range(runs):
+        for directory in reset:
+            shutil.rmtree(os.path.join(cwd, directory), ignore_errors=True)
+        out = subprocess.run(
+            [sys.executable, "-c", textwrap.dedent(snippet)],
+            cwd=cwd, env=env, capture_output=True, text=True, check=True
+        )
+        times.append(float(out.stdout.strip().splitlines()[-1]))
+    return statistics.median(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure dashboard cold-start cost with and without fast start")
+    parser.add_argument("--data", default=os.path.join(APP_DIR, "Jira.csv"), help="Jira CSV export to scale up")
+    parser.add_argument("--scale", type=int, default=200, help="Copies of every ticket in the benchmark dataset")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement")
+    parser.add_argument("--skip-app", action="store_true", help="Skip the (slow) full first-run measurement")
+    args = parser.parse_args(argv)
+
+    from data import PRECOMPILED_DIR
+    from fast_start import warm
+    from snapshots import DEFAULT_STORE_DIR
+
+    # Default runs start with nothing on disk; fast-start runs keep what warm() prepared
+    default_reset = (PRECOMPILED_DIR, DEFAULT_STORE_DIR)
+    fast_reset = (DEFAULT_STORE_DIR,)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        scaled_export(args.data, os.path.join(workdir, "Jira.csv"), args.scale)
+        print(f"Dataset: {args.scale}x export, median of {args.runs} cold runs\n")
+
+        results = []
+        load_csv = measure(LOAD_CSV, workdir, args.runs, default_reset)
+        if not args.skip_app:
+            app_cold = measure(FIRST_RUN.format(app=os.path.join(APP_DIR, "app.py")), workdir, args.runs, default_reset)
+
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            warm("Jira.csv")
+        finally:
+            os.chdir(cwd)
+
+        results.append(("Dataset load", load_csv, measure(LOAD_PRECOMPILED, workdir, args.runs, fast_reset)))
+        if not args.skip_app:
+            app_warm = measure(FIRST_RUN.format(app=os.path.join(APP_DIR, "app.py")), workdir, args.runs, fast_reset)
+            results.append(("First script run", app_cold, app_warm))
+
+    print(f"{'':<24}{'default':>10}{'fast start':>12}{'speed-up':>10}")
+    for label, default, fast in results:
+        print(f"{label:<24}{default:>9.3f}s{fast:>11.3f}s{default / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
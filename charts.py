@@ -0,0 +1,451 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from data import fingerprint
+
+# Series longer than this switch to WebGL (Scattergl) traces
+WEBGL_THRESHOLD = 500
+# Line / area series are downsampled to at most this many points
+MAX_POINTS = 2000
+# Bar charts keep the top N categories and bucket the rest into "Others"
+MAX_BARS = 30
+# Heatmap keeps the most recent N week columns
+MAX_HEATMAP_WEEKS = 52
+# Line charts with one trace per person keep the top N people
+MAX_TRACES = 12
+# Built figures kept in memory
+FIGURE_CACHE_SIZE = 256
+
+GRID_COLOR = 'rgba(255,255,255,0.05)'
+FONT = dict(color='#a0aec0')
+
+_figure_cache = OrderedDict()
+_figure_cache_lock = threading.Lock()
+
+
+def _plotly():
+    """Import Plotly on first use, so importing this module stays cheap"""
+    import plotly.express as px
+    import plotly.graph_objects as go
+    return px, go
+
+
+def figure_spec(builder, data, **options):
+    """Build (or reuse) the figure for an aggregate
+
+    Figures are cached by builder, the aggregate's fingerprint and any options,
+    so reruns with unchanged data skip building and validating the figure;
+    st.plotly_chart still serializes it. Cached figures are shared between
+    sessions and must not be modified.
+    """
+    key = (builder.__name__, fingerprint(data), tuple(sorted(options.items())))
+
+    with _figure_cache_lock:
+        if key in _figure_cache:
+            _figure_cache.move_to_end(key)
+            return _figure_cache[key]
+
+    fig = builder(data, **options)
+
+    with _figure_cache_lock:
+        _figure_cache[key] = fig
+        while len(_figure_cache) > FIGURE_CACHE_SIZE:
+            _figure_cache.popitem(last=False)
+    return fig
+
+
+# --- Size reduction helpers ---
+
+def top_n(df, label, value, n=MAX_BARS, other_label="Others"):
+    """Keep the n-1 largest rows by `value`, summing the rest into one bucket"""
+    if len(df) <= n:
+        return df
+    df = df.sort_values(value, ascending=False)
+    head, tail = df.iloc[:n - 1], df.iloc[n - 1:]
+    others = tail.drop(columns=label).sum(numeric_only=True).to_frame().T
+    others.insert(0, label, f"{other_label} ({len(tail)})")
+    return pd.concat([head, others], ignore_index=True)
+
+
+def downsample(df, x, y, max_points=MAX_POINTS):
+    """Sum a date series into coarser buckets until it fits in max_points"""
+    if len(df) <= max_points:
+        return df
+    dates = pd.to_datetime(df[x])
+    for freq in ['W', 'M', 'Q', 'Y']:
+        binned = df.groupby(dates.dt.to_period(freq).dt.start_time)[y].sum()
+        if len(binned) <= max_points:
+            return binned.rename_axis(x).reset_index()
+    # Fall back to evenly spaced buckets
+    buckets = np.arange(len(df)) * max_points // len(df)
+    return df.groupby(buckets).agg({x: 'first', y: 'sum'}).reset_index(drop=True)
+
+
+def use_webgl(fig, points):
+    """Swap SVG scatter traces for WebGL ones on long series"""
+    _, go = _plotly()
+    if points <= WEBGL_THRESHOLD:
+        return fig
+    traces = []
+    for trace in fig.data:
+        if isinstance(trace, go.Scatter):
+            props = trace.to_plotly_json()
+            props.pop('type', None)
+            # Scattergl has no stacking; area charts fill to zero instead
+            if props.pop('stackgroup', None) is not None:
+                props['fill'] = 'tozeroy'
+            trace = go.Scattergl(props, skip_invalid=True)
+        traces.append(trace)
+    return go.Figure(data=traces, layout=fig.layout)
+
+
+# --- Overview ---
+
+def workload_figure(workload):
+    """Stacked completed / remaining bars per assignee"""
+    _, go = _plotly()
+    workload = top_n(workload, 'Assignee', 'Total').sort_values('Total', ascending=True)
+    remaining = workload['Total'] - workload['Completed']
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        name='Completed',
+        y=workload['Assignee'],
+        x=workload['Completed'],
+        orientation='h',
+        marker_color='#48bb78',
+        text=workload['Completed'],
+        textposition='inside'
+    ))
+    fig.add_trace(go.Bar(
+        name='Remaining',
+        y=workload['Assignee'],
+        x=remaining,
+        orientation='h',
+        marker_color='#667eea',
+        text=remaining,
+        textposition='inside'
+    ))
+
+    fig.update_layout(
+        barmode='stack',
+        height=max(400, 18 * len(workload)),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=FONT,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        margin=dict(l=0, r=0, t=30, b=0),
+        xaxis=dict(showgrid=True, gridcolor=GRID_COLOR),
+        yaxis=dict(showgrid=False)
+    )
+    return fig
+
+
+def donut_figure(dist, names, colors):
+    """Donut chart of a value_counts frame (name column + Count)"""
+    px, _ = _plotly()
+    dist = top_n(dist, names, 'Count', n=MAX_BARS)
+    fig = px.pie(
+        dist,
+        values='Count',
+        names=names,
+        hole=0.5,
+        color_discrete_sequence=list(colors)
+    )
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=FONT,
+        legend=dict(orientation="h", yanchor="bottom", y=-0.3),
+        margin=dict(l=20, r=20, t=20, b=60),
+        height=300
+    )
+    return fig
+
+
+def status_figure(status_dist):
+    fig = donut_figure(status_dist, 'Status', ('#48bb78', '#667eea', '#f6ad55', '#fc8181', '#b794f4', '#68d391'))
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+
+def issue_type_figure(type_dist):
+    return donut_figure(type_dist, 'Type', ('#667eea', '#b794f4', '#f6ad55', '#fc8181'))
+
+
+def priority_figure(priority_dist):
+    px, _ = _plotly()
+    priority_colors = {
+        'Highest': '#fc8181',
+        'High': '#f6ad55',
+        'Medium': '#68d391',
+        'Low': '#4fd1c5',
+        'Lowest': '#667eea'
+    }
+
+    fig = px.bar(
+        top_n(priority_dist, 'Priority', 'Count'),
+        x='Priority',
+        y='Count',
+        color='Priority',
+        color_discrete_map=priority_colors,
+        text='Count'
+    )
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=FONT,
+        showlegend=False,
+        margin=dict(l=0, r=0, t=20, b=0),
+        height=300,
+        xaxis=dict(showgrid=False),
+        yaxis=dict(showgrid=True, gridcolor=GRID_COLOR)
+    )
+    fig.update_traces(textposition='outside')
+    return fig
+
+
+# --- Individual Performance ---
+
+def person_status_figure(p_status):
+    px, _ = _plotly()
+    fig = px.bar(
+        top_n(p_status, 'Status', 'Count'),
+        x='Status',
+        y='Count',
+        color='Status',
+        color_discrete_sequence=['#48bb78', '#667eea', '#f6ad55', '#fc8181', '#b794f4']
+    )
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=FONT,
+        showlegend=False,
+        height=300,
+        margin=dict(l=0, r=0, t=10, b=0)
+    )
+    return fig
+
+
+def timeline_figure(p_timeline):
+    """Tickets created per day (downsampled for long histories)"""
+    px, _ = _plotly()
+    points = len(p_timeline)
+    fig = px.area(
+        downsample(p_timeline, 'Date', 'Count'),
+        x='Date',
+        y='Count',
+        color_discrete_sequence=['#667eea']
+    )
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=FONT,
+        height=300,
+        margin=dict(l=0, r=0, t=10, b=0),
+        xaxis=dict(showgrid=False),
+        yaxis=dict(showgrid=True, gridcolor=GRID_COLOR)
+    )
+    return use_webgl(fig, points)
+
+
+def comparison_figure(comparison_data):
+    """Grouped bars: one trace per person column"""
+    _, go = _plotly()
+    fig = go.Figure()
+    for person, color in zip(comparison_data.columns[1:], ['#667eea', '#b794f4']):
+        fig.add_trace(go.Bar(
+            name=person,
+            x=comparison_data['Metric'],
+            y=comparison_data[person],
+            marker_color=color
+        ))
+    fig.update_layout(
+        barmode='group',
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=FONT,
+        height=300,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02)
+    )
+    return fig
+
+
+# --- Trends & Analytics ---
+
+def weekly_figure(weekly):
+    """Created vs resolved per week"""
+    _, go = _plotly()
+    fig = go.Figure()
+    for column, color in [('Created', '#667eea'), ('Resolved', '#48bb78')]:
+        fig.add_trace(go.Scatter(
+            x=weekly['Week'],
+            y=weekly[column],
+            mode='lines+markers',
+            name=column,
+            line=dict(color=color, width=3),
+            marker=dict(size=8)
+        ))
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=FONT,
+        height=350,
+        xaxis=dict(title='ISO Week', showgrid=False),
+        yaxis=dict(showgrid=True, gridcolor=GRID_COLOR),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02)
+    )
+    return use_webgl(fig, len(weekly))
+
+
+def resolution_figure(resolution_data, nbins=20):
+    """Histogram of resolution days, binned server-side so payload is nbins bars"""
+    _, go = _plotly()
+    counts, edges = np.histogram(resolution_data.to_numpy(dtype=float), bins=nbins)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color='#667eea'
+    ))
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=FONT,
+        height=350,
+        bargap=0,
+        xaxis=dict(title='Days to Resolve', showgrid=False),
+        yaxis=dict(title='Count', showgrid=True, gridcolor=GRID_COLOR),
+        showlegend=False
+    )
+    return fig
+
+
+def heatmap_figure(pivot_table):
+    """Day-of-week x week heatmap (most recent weeks only)"""
+    px, _ = _plotly()
+    # Columns are chronological ISO year-weeks, so the last ones are the latest
+    pivot_table = pivot_table.sort_index(axis=1).iloc[:, -MAX_HEATMAP_WEEKS:]
+    fig = px.imshow(
+        pivot_table,
+        color_continuous_scale='Viridis',
+        aspect='auto'
+    )
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=FONT,
+        height=300,
+        xaxis=dict(title='ISO Week'),
+        yaxis=dict(title='')
+    )
+    return fig
+
+
+def reporter_figure(reporter_dist):
+    px, _ = _plotly()
+    fig = px.bar(
+        reporter_dist,
+        x='Count',
+        y='Reporter',
+        orientation='h',
+        color='Count',
+        color_continuous_scale='Viridis'
+    )
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=FONT,
+        height=350,
+        showlegend=False,
+        xaxis=dict(showgrid=True, gridcolor=GRID_COLOR),
+        yaxis=dict(showgrid=False)
+    )
+    return fig
+
+
+def backlog_figure(backlog):
+    """Status group counts per snapshot (wide frame indexed by Day)"""
+    px, _ = _plotly()
+    points = len(backlog)
+    long = backlog.reset_index().melt(id_vars='Day', var_name='Status', value_name='Count')
+    fig = px.line(
+        long,
+        x='Day',
+        y='Count',
+        color='Status',
+        markers=True,
+        color_discrete_map={'Done': '#48bb78', 'In Progress': '#667eea', 'To Do': '#f6ad55'}
+    )
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=FONT,
+        height=350,
+        xaxis=dict(title='Snapshot', showgrid=False),
+        yaxis=dict(showgrid=True, gridcolor=GRID_COLOR),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02)
+    )
+    return use_webgl(fig, points)
+
+
+def open_load_figure(open_load):
+    """Open tickets per assignee per snapshot (busiest people only)"""
+    px, _ = _plotly()
+    points = len(open_load)
+    if len(open_load.columns) > MAX_TRACES:
+        busiest = open_load.iloc[-1].sort_values(ascending=False).index[:MAX_TRACES]
+        open_load = open_load[busiest]
+    long = open_load.reset_index().melt(id_vars='Day', var_name='Assignee', value_name='Open')
+    fig = px.line(
+        long,
+        x='Day',
+        y='Open',
+        color='Assignee',
+        color_discrete_sequence=['#667eea', '#b794f4', '#f6ad55', '#fc8181', '#48bb78', '#4fd1c5']
+    )
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=FONT,
+        height=350,
+        xaxis=dict(title='Snapshot', showgrid=False),
+        yaxis=dict(title='Open Tickets', showgrid=True, gridcolor=GRID_COLOR),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02)
+    )
+    return use_webgl(fig, points)
+
+
+# --- Aging WIP ---
+
+def aging_figure(bucket_counts):
+    """Open tickets per assignee stacked by age-in-status bucket"""
+    _, go = _plotly()
+    buckets = list(bucket_counts.columns)
+    counts = bucket_counts.reset_index()
+    counts['Total'] = counts[buckets].sum(axis=1)
+    counts = top_n(counts, 'Assignee', 'Total').sort_values('Total', ascending=True)
+
+    colors = ['#48bb78', '#68d391', '#4fd1c5', '#f6ad55', '#fc8181', '#e53e3e']
+    fig = go.Figure()
+    for bucket, color in zip(buckets, colors):
+        fig.add_trace(go.Bar(
+            name=str(bucket),
+            y=counts['Assignee'],
+            x=counts[bucket],
+            orientation='h',
+            marker_color=color
+        ))
+    fig.update_layout(
+        barmode='stack',
+        height=max(350, 18 * len(counts)),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=FONT,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, title_text='In status'),
+        margin=dict(l=0, r=0, t=30, b=0),
+        xaxis=dict(title='Open Tickets', showgrid=True, gridcolor=GRID_COLOR),
+        yaxis=dict(showgrid=False)
+    )
+    return fig
@@ -0,0 +1,520 @@
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import traceback
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+import metrics
+from aging import AgingEngine
+from data import JIRA_DATE_FORMAT, read_export
+from partitions import load_partition, project_manifest
+from side_tables import COMMENT_DATE_FORMAT, PERSON_COLUMNS, comment_activity, read_side_tables, watcher_load
+from snapshots import SnapshotStore
+from teams import NO_TEAM, TEAM_COLUMN, TEAM_SEPARATOR, TeamIndex
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+PROJECTS = {'SCRUM': 'Wholesale On Wheels', 'OPS': 'Operations', 'WEB': 'Storefront'}
+TEAMS = ['Engineering/Backend', 'Engineering/Frontend', 'Engineering/Backend/Search', 'Design', 'Support', '']
+STATUSES = metrics.DONE_STATUSES + metrics.IN_PROGRESS_STATUSES + metrics.TODO_STATUSES + ['Blocked', '']
+PRIORITIES = ['Highest', 'High', 'Medium', 'Low', 'Lowest', '']
+ISSUE_TYPES = ['Task', 'Bug', 'Story', 'Feature', 'Epic', '']
+
+# Floats are compared to this relative tolerance (summation order may differ)
+RTOL = 1e-9
+
+
+# --- Reference computations (the original pandas logic from main() / render_leaderboard) ---
+
+def reference_filter(df, projects, team_path, members, mapping, statuses, priorities, date_range):
+    """Row filter written the naive way: whole-frame isin and per-row team paths"""
+    df = df[df['Project key'].fillna('NONE').isin(projects)]
+
+    teams = df['Assignee'].map(mapping) if mapping is not None else pd.Series(None, index=df.index, dtype=object)
+    teams = teams.fillna(df[TEAM_COLUMN].fillna(NO_TEAM))
+    paths = teams.map(lambda team: tuple(p.strip() for p in str(team).split(TEAM_SEPARATOR) if p.strip()) or (NO_TEAM,))
+    in_team = paths.map(lambda path: path[:len(team_path)] == tuple(team_path))
+
+    selected_assignees = members or df.loc[in_team, 'Assignee'].unique().tolist()
+    mask = (
+        in_team &
+        df['Assignee'].isin(selected_assignees) &
+        df['Status'].isin(statuses) &
+        df['Priority'].isin(priorities)
+    )
+
+    if date_range and len(date_range) == 2:
+        start_date, end_date = date_range
+        mask &= (df['Created'].dt.date >= start_date) & (df['Created'].dt.date <= end_date)
+
+    return df, df[mask]
+
+
+def reference_view(df, filtered_df, done_statuses, in_progress_statuses, todo_statuses):
+    """Every number main() puts on screen, computed as the original main() did"""
+    # main() stops with a warning when nothing matches
+    if filtered_df.empty:
+        return {'empty': True}
+    out = {}
+
+    total_tickets = len(filtered_df)
+    completed = len(filtered_df[filtered_df['Status'].isin(done_statuses)])
+    in_progress = len(filtered_df[filtered_df['Status'].isin(in_progress_statuses)])
+    todo = len(filtered_df[filtered_df['Status'].isin(todo_statuses)])
+    completion_rate = (completed / total_tickets * 100) if total_tickets > 0 else 0
+    resolved_df = filtered_df[filtered_df['Resolution Days'].notna()]
+    avg_resolution = resolved_df['Resolution Days'].mean() if not resolved_df.empty else 0
+    out['kpis'] = {
+        'total': total_tickets,
+        'completed': completed,
+        'in_progress': in_progress,
+        'todo': todo,
+        'completion_rate': completion_rate,
+        'avg_resolution': avg_resolution
+    }
+
+    leaderboard = filtered_df.groupby('Assignee').agg({
+        'Issue key': 'count',
+        'Status': lambda x: (x.isin(done_statuses)).sum()
+    }).reset_index()
+    leaderboard.columns = ['Assignee', 'Total', 'Completed']
+    leaderboard['Efficiency'] = (leaderboard['Completed'] / leaderboard['Total'] * 100).round(1)
+    out['leaderboard'] = leaderboard.sort_values('Completed', ascending=False)
+
+    workload = filtered_df.groupby('Assignee').agg({
+        'Issue key': 'count',
+        'Status': lambda x: (x.isin(done_statuses)).sum()
+    }).reset_index()
+    workload.columns = ['Assignee', 'Total', 'Completed']
+    out['workload'] = workload.sort_values('Total', ascending=True)
+
+    for column in ['Status', 'Priority', 'Issue Type']:
+        # value_counts leaves tie order to row order; the charts order ties by label
+        counts = filtered_df[column].value_counts()
+        out[f'breakdown {column}'] = counts.sort_index().sort_values(ascending=False, kind='stable')
+
+    # Weeks keyed on ISO (year, week) so the same week number in different years stays apart
+    iso = filtered_df['Created'].dt.isocalendar()
+    weekly = filtered_df.groupby([iso['year'], iso['week']]).agg({
+        'Issue key': 'count',
+        'Status': lambda x: (x.isin(done_statuses)).sum()
+    }).reset_index()
+    weekly.insert(0, 'Week', [f"{year}-W{week:02d}" for year, week in zip(weekly.pop('year'), weekly.pop('week'))])
+    weekly.columns = ['Week', 'Created', 'Resolved']
+    out['weekly'] = weekly
+
+    resolution_data = filtered_df[filtered_df['Resolution Days'].notna()]['Resolution Days']
+    out['resolution'] = resolution_data.describe()
+
+    # Individual Performance uses the unfiltered (project-scoped) frame
+    people = {}
+    for person in sorted(filtered_df['Assignee'].unique()):
+        person_df = df[df['Assignee'] == person]
+        p_total = len(person_df)
+        p_done = len(person_df[person_df['Status'].isin(done_statuses)])
+        p_progress = len(person_df[person_df['Status'].isin(in_progress_statuses)])
+        p_efficiency = (p_done / p_total * 100) if p_total > 0 else 0
+        p_resolved = person_df[person_df['Resolution Days'].notna()]
+        p_avg_resolution = p_resolved['Resolution Days'].mean() if not p_resolved.empty else 0
+        completed_counts = df[df['Status'].isin(done_statuses)].groupby('Assignee').size().sort_values(ascending=False)
+        rank = list(completed_counts.index).index(person) + 1 if person in completed_counts.index else "N/A"
+        people[person] = (p_total, p_done, p_progress, p_efficiency, p_avg_resolution, rank)
+    out['people'] = people
+
+    return out
+
+
+# --- Optimized paths (the app's own loaders, filter and metrics) ---
+
+def optimized_view(partition_dir, manifest, projects, team_path, members, mapping, statuses, priorities, date_range):
+    """Partitions + TeamIndex row resolution + metrics.py, as wired in app.main()"""
+    # Like app.load_data: partitions concatenated in selection order
+    keys = [key for key in projects if key in set(manifest['Project key'])]
+    frames = [load_partition(key, partition_dir) for key in keys]
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    index = TeamIndex(df, mapping)
+    filtered_df = df[metrics.filter_mask(df, index, team_path, members, statuses, priorities, date_range)]
+    if filtered_df.empty:
+        return {'empty': True}
+
+    out = {
+        'kpis': metrics.kpis(filtered_df),
+        'leaderboard': metrics.leaderboard(filtered_df),
+        'workload': metrics.workload(filtered_df),
+        'weekly': metrics.weekly_trend(filtered_df),
+        'resolution': metrics.resolution_days(filtered_df).describe(),
+    }
+    for column in ['Status', 'Priority', 'Issue Type']:
+        dist = metrics.distribution(filtered_df, column)
+        out[f'breakdown {column}'] = dist.set_index(column)['Count'].rename('count').rename_axis(column)
+
+    people = {}
+    for person in sorted(filtered_df['Assignee'].unique()):
+        summary = metrics.person_summary(df[df['Assignee'] == person])
+        people[person] = (
+            summary['total'], summary['done'], summary['in_progress'],
+            summary['efficiency'], summary['avg_resolution'], metrics.team_rank(df, person)
+        )
+    out['people'] = people
+    return out
+
+
+# --- Comparison ---
+
+def assert_same(name, expected, actual):
+    """Raise AssertionError naming the output that differs"""
+    try:
+        if isinstance(expected, pd.DataFrame):
+            pd.testing.assert_frame_equal(
+                expected.reset_index(drop=True), actual.reset_index(drop=True),
+                check_dtype=False, rtol=RTOL
+            )
+        elif isinstance(expected, pd.Series):
+            pd.testing.assert_series_equal(expected, actual, check_dtype=False, check_names=False, rtol=RTOL)
+        elif isinstance(expected, dict):
+            assert expected.keys() == actual.keys(), f"keys differ: {sorted(expected)} vs {sorted(actual)}"
+            for key in expected:
+                assert_same(f"{name}[{key}]", expected[key], actual[key])
+        elif isinstance(expected, tuple):
+            assert len(expected) == len(actual)
+            for i, (e, a) in enumerate(zip(expected, actual)):
+                assert_same(f"{name}[{i}]", e, a)
+        elif isinstance(expected, float) or isinstance(actual, float):
+            assert abs(float(expected) - float(actual)) <= RTOL * max(1.0, abs(float(expected))), f"{expected} != {actual}"
+        else:
+            assert expected == actual, f"{expected!r} != {actual!r}"
+    except AssertionError as e:
+        raise AssertionError(f"{name}: {e}") from None
+
+
+# --- Dataset generation ---
+
+def export_header():
+    """Column layout of a real Jira export (repeated Watchers / Comment columns included)"""
+    with open(os.path.join(APP_DIR, "Jira.csv"), newline='', encoding='utf-8') as f:
+        return next(csv.reader(f))
+
+
+def generate_tickets(rng, n_tickets, n_people):
+    people = [f"Person {i:03d}" for i in range(n_people)] + ['']
+    start = datetime(2024, 1, 1)
+    tickets = []
+    for i in range(n_tickets):
+        project = rng.choice(list(PROJECTS))
+        created = start + timedelta(minutes=rng.randrange(0, 2 * 365 * 24 * 60))
+        tickets.append({
+            'Summary': f"Ticket {i}",
+            'Issue key': f"{project}-{i}",
+            'Issue id': str(10000 + i),
+            'Issue Type': rng.choice(ISSUE_TYPES),
+            'Project key': project,
+            'Project name': PROJECTS[project],
+            'Priority': rng.choice(PRIORITIES),
+            'Assignee': rng.choice(people),
+            'Reporter': rng.choice(people),
+            'Created': created,
+            'Status': rng.choice(STATUSES),
+            TEAM_COLUMN: rng.choice(TEAMS),
+            'Watchers': rng.sample(people[:-1], rng.randrange(0, 4)),
+            'Comments': [
+                (created + timedelta(minutes=rng.randrange(0, 60 * 24 * 60)), rng.choice(people[:-1]))
+                for _ in range(rng.randrange(0, 3))
+            ],
+        })
+        _touch(rng, tickets[-1], created)
+    return tickets
+
+
+def _touch(rng, ticket, since):
+    """Set Updated / Resolved / Status Category Changed consistently with Status"""
+    changed = since + timedelta(minutes=rng.randrange(0, 60 * 24 * 30))
+    ticket['Updated'] = changed + timedelta(minutes=rng.randrange(0, 60 * 24 * 5))
+    ticket['Status Category Changed'] = changed
+    done = ticket['Status'] in metrics.DONE_STATUSES
+    ticket['Resolved'] = changed if done and rng.random() < 0.9 else None
+
+
+def mutate_tickets(rng, tickets, day):
+    """Simulate a day of activity: status / assignee / priority changes, new and deleted tickets"""
+    tickets = [dict(t) for t in tickets if rng.random() > 0.02]
+    people = sorted({t['Assignee'] for t in tickets})
+    for ticket in tickets:
+        roll = rng.random()
+        if roll < 0.15:
+            ticket['Status'] = rng.choice(STATUSES)
+            _touch(rng, ticket, day)
+        elif roll < 0.18 and ticket['Status'] in metrics.IN_PROGRESS_STATUSES:
+            # Move within the category: Jira keeps the category stamp
+            ticket['Status'] = rng.choice([s for s in metrics.IN_PROGRESS_STATUSES if s != ticket['Status']])
+            ticket['Updated'] = day + timedelta(minutes=rng.randrange(0, 60 * 24))
+        elif roll < 0.2:
+            ticket['Assignee'] = rng.choice(people)
+        elif roll < 0.23:
+            ticket['Priority'] = rng.choice(PRIORITIES)
+    next_id = max(int(t['Issue id']) for t in tickets) + 1
+    for i in range(rng.randrange(0, 10)):
+        new = generate_tickets(rng, 1, len(people))[0]
+        new['Issue id'] = str(next_id + i)
+        new['Issue key'] = f"{new['Project key']}-{next_id + i}"
+        tickets.append(new)
+    return tickets
+
+
+def account_id(name):
+    """Stable fake Jira account id for a generated person"""
+    return f"acct-{name.replace(' ', '-')}" if name else ''
+
+
+def write_export(tickets, header, path):
+    fmt = lambda value: value.strftime(JIRA_DATE_FORMAT) if isinstance(value, datetime) else (value or '')
+    slots = {field: [i for i, c in enumerate(header) if c == field] for field in ('Watchers', 'Watchers Id', 'Comment')}
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for ticket in tickets:
+            row = []
+            for column in header:
+                value = ticket.get(column) if column not in slots else None
+                if column in ('Assignee Id', 'Reporter Id'):
+                    value = account_id(ticket.get(column[:-len(' Id')]))
+                row.append(fmt(value))
+            for name_slot, id_slot, watcher in zip(slots['Watchers'], slots['Watchers Id'], ticket['Watchers']):
+                row[name_slot], row[id_slot] = watcher, account_id(watcher)
+            for slot, (created, author) in zip(slots['Comment'], ticket.get('Comments', [])):
+                row[slot] = f"{created.strftime(COMMENT_DATE_FORMAT)};{account_id(author)};Note; with a semicolon"
+            writer.writerow(row)
+
+
+def random_filters(rng, df, index):
+    """One random sidebar state: projects, team node, members, statuses, priorities, dates"""
+    projects = rng.sample(list(PROJECTS), rng.randrange(1, len(PROJECTS) + 1))
+    team_path = rng.choice(index.nodes())
+    team_members = index.members(team_path)
+    members = rng.sample(team_members, rng.randrange(0, min(4, len(team_members)) + 1)) if rng.random() < 0.5 else []
+    statuses = sorted(df['Status'].unique())
+    statuses = rng.sample(statuses, rng.randrange(1, len(statuses) + 1))
+    priorities = sorted(df['Priority'].unique())
+    priorities = rng.sample(priorities, rng.randrange(1, len(priorities) + 1))
+    date_range = None
+    if rng.random() < 0.6:
+        lo, hi = df['Created'].min().date(), df['Created'].max().date()
+        a = lo + timedelta(days=rng.randrange(0, (hi - lo).days + 1))
+        b = lo + timedelta(days=rng.randrange(0, (hi - lo).days + 1))
+        date_range = (min(a, b), max(a, b))
+    return projects, team_path, members, statuses, priorities, date_range
+
+
+# --- Checks ---
+
+def check_views(rng, export_path, workdir, trials, mapping):
+    full = read_export(export_path)
+    partition_dir = os.path.join(workdir, "projects")
+    manifest = project_manifest(export_path, partition_dir)
+    index = TeamIndex(full, mapping)
+
+    for trial in range(trials):
+        projects, team_path, members, statuses, priorities, date_range = random_filters(rng, full, index)
+        scoped, filtered = reference_filter(full, projects, team_path, members, mapping, statuses, priorities, date_range)
+        expected = reference_view(
+            scoped, filtered, metrics.DONE_STATUSES, metrics.IN_PROGRESS_STATUSES, metrics.TODO_STATUSES
+        )
+        actual = optimized_view(
+            partition_dir, manifest, projects, team_path, members, mapping, statuses, priorities, date_range
+        )
+        try:
+            assert_same("view", expected, actual)
+        except AssertionError as e:
+            raise AssertionError(
+                f"trial {trial} (projects={projects}, team={team_path}, members={members}, "
+                f"statuses={statuses}, priorities={priorities}, dates={date_range}): {e}"
+            ) from None
+    return trials
+
+
+def reference_collaboration(export_path, df):
+    """Watcher load and comment activity counted cell by cell from the raw CSV"""
+    with open(export_path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = list(reader)
+    column = {c: header.index(c) for c in header}
+    slots = {field: [i for i, c in enumerate(header) if c == field] for field in ('Watchers', 'Watchers Id', 'Comment')}
+    pairs = [(column[name], column[id_]) for name, id_ in PERSON_COLUMNS if name in column and id_ in column]
+    pairs += list(zip(slots['Watchers'], slots['Watchers Id']))
+
+    # Account -> first display name seen next to it
+    names = {}
+    for row in rows:
+        for name_col, id_col in pairs:
+            if row[id_col] and row[name_col]:
+                names.setdefault(row[id_col], row[name_col])
+
+    watchers, comments = {}, []
+    for row in rows:
+        ticket = int(row[column['Issue id']])
+        watchers[ticket] = {
+            row[id_col] or row[name_col]
+            for name_col, id_col in zip(slots['Watchers'], slots['Watchers Id'])
+            if row[id_col] or row[name_col]
+        }
+        for slot in slots['Comment']:
+            if row[slot]:
+                created, account, _ = row[slot].split(';', 2)
+                comments.append((ticket, account, datetime.strptime(created, COMMENT_DATE_FORMAT)))
+
+    owners = dict(zip(df['Issue id'], df['Assignee']))
+    assignees = sorted(set(owners.values()))
+    load, activity = [], []
+    for person in assignees:
+        tickets = [t for t, owner in owners.items() if owner == person]
+        watcher_count = sum(len(watchers.get(t, ())) for t in tickets)
+        watching = sum(
+            1 for t in owners for account in watchers.get(t, ()) if names.get(account, account) == person
+        )
+        load.append({
+            'Assignee': person, 'Tickets': len(tickets), 'Watchers': watcher_count,
+            'Avg Watchers': round(watcher_count / len(tickets), 2), 'Watching': watching
+        })
+        written = [created for t, account, created in comments if t in owners and names.get(account, account) == person]
+        activity.append({
+            'Assignee': person,
+            'Comments Received': sum(1 for t, _, _ in comments if owners.get(t) == person),
+            'Comments Written': len(written),
+            'Last Comment': max(written) if written else pd.NaT
+        })
+    activity = pd.DataFrame(activity)
+    activity['Last Comment'] = pd.to_datetime(activity['Last Comment'])
+    return pd.DataFrame(load), activity
+
+
+def check_side_tables(export_path):
+    """Side-table watcher load and comment activity vs counting the raw repeated columns"""
+    df = read_export(export_path)
+    side = read_side_tables(export_path)
+    expected_load, expected_activity = reference_collaboration(export_path, df)
+    assert_same("watcher load", expected_load, watcher_load(side, df))
+    assert_same("comment activity", expected_activity, comment_activity(side, df))
+    return 2
+
+
+def reference_entered(previous, df):
+    """Entry time into the current status per ticket, replayed one ticket at a time
+
+    `previous` maps Issue id -> (Status, raw category stamp, entry time) from the
+    prior export; the same mapping is returned for this one.
+    """
+    state = {}
+    for row in df.drop_duplicates('Issue id', keep='last').to_dict('records'):
+        raw = row.get('Status Category Changed')
+        raw = '' if pd.isna(raw) else raw
+        fallback = row['Updated'] if pd.notna(row['Updated']) else row['Created']
+        prior = previous.get(row['Issue id'])
+        if prior is not None and prior[1] == raw:
+            entered = prior[2] if prior[0] == row['Status'] else fallback
+        else:
+            stamp = pd.to_datetime(raw or None, format=JIRA_DATE_FORMAT, errors='coerce')
+            entered = stamp if pd.notna(stamp) else fallback
+        state[row['Issue id']] = (row['Status'], raw, entered)
+    return state
+
+
+def check_history(rng, tickets, header, workdir, days):
+    """Snapshot reconstruction vs each export, incremental aging vs a per-ticket replay"""
+    store = SnapshotStore(os.path.join(workdir, "snapshots"))
+    engine = AgingEngine()
+    groups = metrics.status_groups()
+    exports = []
+    entered = {}
+
+    day = datetime(2026, 1, 1)
+    for d in range(days):
+        path = os.path.join(workdir, f"export-{d}.csv")
+        write_export(tickets, header, path)
+        df = read_export(path)
+        store.record(df, day)
+        engine.update(df, version=d)
+        exports.append((day, df))
+
+        entered = reference_entered(entered, df)
+        ages = engine.ages(now=day).set_index('Issue id')['In Status Since'].sort_index()
+        expected = pd.Series({issue: e[2] for issue, e in entered.items()}, dtype='datetime64[ns]')
+        assert_same(f"aging day {d}", expected.reindex(ages.index), ages)
+
+        tickets = mutate_tickets(rng, tickets, day)
+        day += timedelta(days=1)
+
+    backlog = store.backlog_series(groups)
+    open_load = store.open_load_series(metrics.DONE_STATUSES)
+    for day, df in exports:
+        state = store.state_at(day).sort_index()
+        expected_state = df.drop_duplicates('Issue id', keep='last').set_index('Issue id')[state.columns].sort_index()
+        assert_same(f"state at {day.date()}", expected_state.astype(object), state)
+
+        expected = df['Status'].map(groups).fillna(df['Status']).value_counts()
+        actual = backlog.loc[pd.Timestamp(day)]
+        assert_same(f"backlog {day.date()}", expected.sort_index(), actual[actual > 0].sort_index())
+
+        open_df = df[~df['Status'].isin(metrics.DONE_STATUSES)]
+        expected = open_df['Assignee'].value_counts()
+        actual = open_load.loc[pd.Timestamp(day)]
+        assert_same(f"open load {day.date()}", expected.sort_index(), actual[actual > 0].sort_index())
+    return days
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Check optimized dashboard paths against the reference pandas logic on generated data"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for data and filter generation")
+    parser.add_argument("--datasets", type=int, default=3, help="Generated exports to check")
+    parser.add_argument("--tickets", type=int, default=2000, help="Tickets per generated export")
+    parser.add_argument("--people", type=int, default=40, help="Distinct assignees per export")
+    parser.add_argument("--trials", type=int, default=25, help="Random filter combinations per export")
+    parser.add_argument("--days", type=int, default=6, help="Daily exports for the history / aging checks")
+    args = parser.parse_args(argv)
+
+    header = export_header()
+    failures = 0
+
+    for dataset in range(args.datasets):
+        rng = random.Random(args.seed * 1000 + dataset)
+        with tempfile.TemporaryDirectory() as workdir:
+            tickets = generate_tickets(rng, args.tickets, args.people)
+            export_path = os.path.join(workdir, "Jira.csv")
+            write_export(tickets, header, export_path)
+
+            # Alternate between the Jira team field and a local mapping file
+            mapping = None
+            if dataset % 2:
+                assignees = sorted({t['Assignee'] or 'Unassigned' for t in tickets})
+                mapping = pd.Series({a: rng.choice(TEAMS[:-1]) for a in assignees if rng.random() < 0.7})
+
+            checks = [
+                ("views", lambda: check_views(rng, export_path, workdir, args.trials, mapping)),
+                ("side tables", lambda: check_side_tables(export_path)),
+                ("history", lambda: check_history(rng, tickets, header, workdir, args.days)),
+            ]
+            for name, check in checks:
+                try:
+                    count = check()
+                    print(f"dataset {dataset}: {name:<12} ok ({count} checked)")
+                except AssertionError as e:
+                    failures += 1
+                    print(f"dataset {dataset}: {name:<12} MISMATCH\n    {e}")
+                except Exception:
+                    failures += 1
+                    print(f"dataset {dataset}: {name:<12} ERROR")
+                    traceback.print_exc()
+
+    print("All optimized paths match the reference." if not failures else f"{failures} check(s) failed.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+import hashlib
+import os
+
+import pandas as pd
+
+from side_tables import is_multi_valued
+
+JIRA_DATE_FORMAT = '%d/%b/%y %I:%M %p'
+
+# Precompiled (already parsed) copies of exports, written by fast_start.py
+PRECOMPILED_DIR = ".cache"
+
+
+def find_data_file(path):
+    """Return the first existing Jira export path, or None"""
+    paths_to_try = [path, "Jira.csv", "../Jira.csv"]
+    
+    for p in paths_to_try:
+        if os.path.exists(p):
+            return p
+    return None
+
+
+def read_export(path):
+    """Read and preprocess a Jira CSV export"""
+    # Multi-valued Watchers / Comment columns live in side tables instead
+    df = pd.read_csv(path, usecols=lambda c: not is_multi_valued(c))
+    
+    # Parse dates
+    date_cols = ['Created', 'Updated', 'Resolved']
+    for col in date_cols:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], format=JIRA_DATE_FORMAT, errors='coerce')
+    
+    # Clean data
+    df['Assignee'] = df['Assignee'].fillna('Unassigned')
+    df['Status'] = df['Status'].fillna('Unknown')
+    df['Priority'] = df['Priority'].fillna('Medium')
+    df['Issue Type'] = df['Issue Type'].fillna('Task')
+    df['Reporter'] = df['Reporter'].fillna('Unknown')
+    
+    # Calculate resolution time (in days)
+    if 'Created' in df.columns and 'Resolved' in df.columns:
+        df['Resolution Days'] = (df['Resolved'] - df['Created']).dt.days
+    
+    # Extract week for trend analysis
+    if 'Created' in df.columns:
+        df['Created Week'] = df['Created'].dt.isocalendar().week
+        df['Created Month'] = df['Created'].dt.month_name()
+    
+    return df
+
+
+def precompiled_path(path, cache_dir=PRECOMPILED_DIR):
+    """Pickle location for an export; the name changes whenever the file does"""
+    stat = os.stat(path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f"{name}-{stat.st_mtime_ns}-{stat.st_size}.pkl")
+
+
+def precompile(path, cache_dir=PRECOMPILED_DIR):
+    """Parse an export once and store the result for fast loading"""
+    target = precompiled_path(path, cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+    read_export(path).to_pickle(target)
+    return target
+
+
+def load_export(path, cache_dir=PRECOMPILED_DIR):
+    """Load an export, using its precompiled copy when one is up to date"""
+    cached = precompiled_path(path, cache_dir)
+    if os.path.exists(cached):
+        return pd.read_pickle(cached)
+    return read_export(path)
+
+
+def fingerprint(data):
+    """Stable content hash of a DataFrame / Series"""
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(data, pd.DataFrame):
+        digest.update(repr(list(data.columns)).encode())
+    else:
+        digest.update(repr(data.name).encode())
+    digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
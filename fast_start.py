@@ -0,0 +1,49 @@
+import argparse
+import compileall
+import glob
+import os
+
+from data import PRECOMPILED_DIR, find_data_file, precompile, precompiled_path
+from partitions import project_manifest
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def warm(path="Jira.csv", cache_dir=PRECOMPILED_DIR):
+    """Prepare everything the first request needs before the server boots
+
+    Byte-compiles the app modules, stores a parsed copy of the export and
+    splits it into per-project partitions, so the first session neither
+    compiles sources nor parses the CSV.
+    """
+    compileall.compile_dir(APP_DIR, maxlevels=0, quiet=1)
+
+    data_file = find_data_file(path)
+    if data_file is None:
+        raise FileNotFoundError(f"Jira export not found: {path}")
+
+    target = precompiled_path(data_file, cache_dir)
+    if not os.path.exists(target):
+        precompile(data_file, cache_dir)
+
+    # Drop copies made from earlier versions of the same export
+    name = os.path.splitext(os.path.basename(data_file))[0]
+    for stale in glob.glob(os.path.join(cache_dir, f"{name}-*.pkl")):
+        if stale != target:
+            os.remove(stale)
+
+    project_manifest(data_file)
+    return target
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm the dashboard's caches ahead of server start")
+    parser.add_argument("--data", default="Jira.csv", help="Jira CSV export")
+    parser.add_argument("--cache-dir", default=PRECOMPILED_DIR, help="Where precompiled data is stored")
+    args = parser.parse_args(argv)
+
+    print(f"Precompiled dataset: {warm(args.data, args.cache_dir)}")
+
+
+if __name__ == "__main__":
+    main()
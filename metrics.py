@@ -0,0 +1,179 @@
+import pandas as pd
+
+# Status categories
+DONE_STATUSES = ['Done', 'Resolved', 'Closed', 'Completed']
+IN_PROGRESS_STATUSES = ['In Progress', 'In Review']
+TODO_STATUSES = ['To Do', 'Idea', 'Open']
+
+DAYS_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def iso_weeks(dates):
+    """ISO year-week labels ("2025-W03") that sort chronologically; NaT stays missing"""
+    iso = dates.dt.isocalendar()
+    labels = iso['year'].astype(str) + '-W' + iso['week'].astype(str).str.zfill(2)
+    return labels.where(dates.notna())
+
+
+def filter_mask(df, team_index, team_path, members, statuses, priorities, date_range=None):
+    """Sidebar filters as a row mask: team / members, statuses, priorities, created-date range"""
+    mask = (
+        team_index.rows(team_path, members) &
+        df['Status'].isin(statuses) &
+        df['Priority'].isin(priorities)
+    )
+    if date_range and len(date_range) == 2:
+        start_date, end_date = date_range
+        mask &= (df['Created'].dt.date >= start_date) & (df['Created'].dt.date <= end_date)
+    return mask
+
+
+def kpis(df, done_statuses=DONE_STATUSES, in_progress_statuses=IN_PROGRESS_STATUSES,
+         todo_statuses=TODO_STATUSES):
+    """Headline counts for the KPI cards"""
+    total_tickets = len(df)
+    completed = len(df[df['Status'].isin(done_statuses)])
+    in_progress = len(df[df['Status'].isin(in_progress_statuses)])
+    todo = len(df[df['Status'].isin(todo_statuses)])
+    completion_rate = (completed / total_tickets * 100) if total_tickets > 0 else 0
+
+    # Average resolution time
+    resolved_df = df[df['Resolution Days'].notna()]
+    avg_resolution = resolved_df['Resolution Days'].mean() if not resolved_df.empty else 0
+
+    return {
+        'total': total_tickets,
+        'completed': completed,
+        'in_progress': in_progress,
+        'todo': todo,
+        'completion_rate': completion_rate,
+        'avg_resolution': avg_resolution
+    }
+
+
+def workload(df, done_statuses=DONE_STATUSES):
+    """Total and completed tickets per assignee"""
+    workload = df.groupby('Assignee').agg({
+        'Issue key': 'count',
+        'Status': lambda x: (x.isin(done_statuses)).sum()
+    }).reset_index()
+    workload.columns = ['Assignee', 'Total', 'Completed']
+    return workload.sort_values('Total', ascending=True)
+
+
+def leaderboard(df, done_statuses=DONE_STATUSES):
+    """Assignees ranked by completed tickets"""
+    leaderboard = df.groupby('Assignee').agg({
+        'Issue key': 'count',
+        'Status': lambda x: (x.isin(done_statuses)).sum()
+    }).reset_index()
+    leaderboard.columns = ['Assignee', 'Total', 'Completed']
+    leaderboard['Efficiency'] = (leaderboard['Completed'] / leaderboard['Total'] * 100).round(1)
+    return leaderboard.sort_values('Completed', ascending=False)
+
+
+def distribution(df, column, label=None):
+    """value_counts of a column as a (label, Count) frame, ties ordered by label"""
+    dist = df[column].value_counts().reset_index()
+    dist.columns = [label or column, 'Count']
+    return dist.sort_values(['Count', label or column], ascending=[False, True], ignore_index=True)
+
+
+def person_summary(person_df, done_statuses=DONE_STATUSES, in_progress_statuses=IN_PROGRESS_STATUSES):
+    """Per-person totals for the Individual Performance view"""
+    p_total = len(person_df)
+    p_done = len(person_df[person_df['Status'].isin(done_statuses)])
+    p_progress = len(person_df[person_df['Status'].isin(in_progress_statuses)])
+    p_efficiency = (p_done / p_total * 100) if p_total > 0 else 0
+
+    # Avg resolution for person
+    p_resolved = person_df[person_df['Resolution Days'].notna()]
+    p_avg_resolution = p_resolved['Resolution Days'].mean() if not p_resolved.empty else 0
+
+    return {
+        'total': p_total,
+        'done': p_done,
+        'in_progress': p_progress,
+        'efficiency': p_efficiency,
+        'avg_resolution': p_avg_resolution
+    }
+
+
+def team_rank(df, person, done_statuses=DONE_STATUSES):
+    """1-based rank by completed tickets, or "N/A" if nothing completed"""
+    completed_counts = df[df['Status'].isin(done_statuses)].groupby('Assignee').size().sort_values(ascending=False)
+    return list(completed_counts.index).index(person) + 1 if person in completed_counts.index else "N/A"
+
+
+def person_summaries(df, done_statuses=DONE_STATUSES, in_progress_statuses=IN_PROGRESS_STATUSES):
+    """person_summary and team_rank for every assignee in one pass, indexed by Assignee"""
+    done = df['Status'].isin(done_statuses)
+    grouped = df.assign(
+        _done=done, _in_progress=df['Status'].isin(in_progress_statuses)
+    ).groupby('Assignee')
+
+    summaries = pd.DataFrame({
+        'total': grouped.size(),
+        'done': grouped['_done'].sum(),
+        'in_progress': grouped['_in_progress'].sum(),
+        'avg_resolution': grouped['Resolution Days'].mean().fillna(0)
+    })
+    summaries['efficiency'] = summaries['done'] / summaries['total'] * 100
+
+    # Same ranking as team_rank, computed once for everyone
+    completed_counts = df[done].groupby('Assignee').size().sort_values(ascending=False)
+    ranks = pd.Series(range(1, len(completed_counts) + 1), index=completed_counts.index, dtype=object)
+    summaries['rank'] = ranks.reindex(summaries.index).fillna("N/A")
+    return summaries
+
+
+def person_timeline(person_df):
+    """Tickets created per day"""
+    p_timeline = person_df.groupby(person_df['Created'].dt.date).size().reset_index(name='Count')
+    p_timeline.columns = ['Date', 'Count']
+    return p_timeline
+
+
+def weekly_trend(df, done_statuses=DONE_STATUSES):
+    """Created vs resolved tickets per ISO year-week"""
+    weekly = df.groupby(iso_weeks(df['Created'])).agg({
+        'Issue key': 'count',
+        'Status': lambda x: (x.isin(done_statuses)).sum()
+    }).reset_index()
+    weekly.columns = ['Week', 'Created', 'Resolved']
+    return weekly
+
+
+def resolution_days(df):
+    """Resolution Days of resolved tickets"""
+    return df[df['Resolution Days'].notna()]['Resolution Days']
+
+
+def activity_heatmap(df):
+    """Tickets created per day-of-week x ISO year-week, weeks in calendar order"""
+    heatmap_data = df.copy()
+    heatmap_data['DayOfWeek'] = heatmap_data['Created'].dt.day_name()
+    heatmap_data['Week'] = iso_weeks(heatmap_data['Created'])
+
+    pivot = heatmap_data.groupby(['DayOfWeek', 'Week']).size().reset_index(name='Count')
+    pivot_table = pivot.pivot(index='DayOfWeek', columns='Week', values='Count').fillna(0)
+
+    # Reorder days
+    return pivot_table.reindex([d for d in DAYS_ORDER if d in pivot_table.index])
+
+
+def top_reporters(df, n=10):
+    """Reporters who create the most tickets"""
+    reporter_dist = df['Reporter'].value_counts().reset_index()
+    reporter_dist.columns = ['Reporter', 'Count']
+    return reporter_dist.sort_values(['Count', 'Reporter'], ascending=[False, True], ignore_index=True).head(n)
+
+
+def status_groups(done_statuses=DONE_STATUSES, in_progress_statuses=IN_PROGRESS_STATUSES,
+                  todo_statuses=TODO_STATUSES):
+    """Status -> To Do / In Progress / Done label"""
+    return {
+        **{s: 'To Do' for s in todo_statuses},
+        **{s: 'In Progress' for s in in_progress_statuses},
+        **{s: 'Done' for s in done_statuses}
+    }
@@ -0,0 +1,109 @@
+import os
+import re
+import uuid
+
+import pandas as pd
+
+from data import PRECOMPILED_DIR, fingerprint, load_export
+
+PROJECT_COLUMN = 'Project key'
+PROJECT_NAME_COLUMN = 'Project name'
+NO_PROJECT = 'NONE'
+
+# One pickle per project plus a manifest describing them
+PARTITION_DIR = os.path.join(PRECOMPILED_DIR, "projects")
+MANIFEST_FILE = "manifest.csv"
+
+
+def source_version(path):
+    """Identifies one version of the export file"""
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def safe_name(project_key):
+    """Project key as a file / directory name"""
+    return re.sub(r'[^A-Za-z0-9_-]+', '_', str(project_key))
+
+
+def _partition_file(project_key, cache_dir):
+    return os.path.join(cache_dir, safe_name(project_key) + ".pkl")
+
+
+def _write_atomic(target, write):
+    """Write `target` via a temp file in the same directory, then swap it in
+
+    Readers in other sessions or processes see either the old file or the
+    complete new one, never a partial write.
+    """
+    directory, name = os.path.split(target)
+    temp = os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+    try:
+        write(temp)
+        os.replace(temp, target)
+    except BaseException:
+        if os.path.exists(temp):
+            os.remove(temp)
+        raise
+
+
+def read_manifest(cache_dir=PARTITION_DIR):
+    """Project key, name, ticket count, partition version and source of each partition"""
+    path = os.path.join(cache_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    return pd.read_csv(path, dtype={PROJECT_COLUMN: str, 'Version': str, 'Source': str})
+
+
+def write_partitions(path, cache_dir=PARTITION_DIR):
+    """Split an export by Project key
+
+    Only partitions whose content changed are rewritten, and each keeps a
+    content version, so caches keyed on it survive other projects' updates.
+    """
+    df = load_export(path)
+    df[PROJECT_COLUMN] = df[PROJECT_COLUMN].fillna(NO_PROJECT).astype(str)
+
+    previous = read_manifest(cache_dir)
+    previous = {} if previous is None else dict(zip(previous[PROJECT_COLUMN], previous['Version']))
+    os.makedirs(cache_dir, exist_ok=True)
+
+    rows = []
+    for project_key, part in df.groupby(PROJECT_COLUMN, sort=True):
+        part = part.reset_index(drop=True)
+        version = fingerprint(part)
+        target = _partition_file(project_key, cache_dir)
+        if previous.get(project_key) != version or not os.path.exists(target):
+            _write_atomic(target, part.to_pickle)
+        rows.append({
+            PROJECT_COLUMN: project_key,
+            PROJECT_NAME_COLUMN: part[PROJECT_NAME_COLUMN].dropna().iloc[0]
+            if PROJECT_NAME_COLUMN in part.columns and part[PROJECT_NAME_COLUMN].notna().any() else project_key,
+            'Tickets': len(part),
+            'Version': version
+        })
+
+    manifest = pd.DataFrame(rows, columns=[PROJECT_COLUMN, PROJECT_NAME_COLUMN, 'Tickets', 'Version'])
+    manifest['Source'] = source_version(path)
+
+    # Drop partitions of projects that are gone from the export
+    for project_key in set(previous) - set(manifest[PROJECT_COLUMN]):
+        stale = _partition_file(project_key, cache_dir)
+        if os.path.exists(stale):
+            os.remove(stale)
+
+    _write_atomic(os.path.join(cache_dir, MANIFEST_FILE), lambda temp: manifest.to_csv(temp, index=False))
+    return manifest
+
+
+def project_manifest(path, cache_dir=PARTITION_DIR):
+    """Manifest for the export, re-partitioning first if the export changed"""
+    manifest = read_manifest(cache_dir)
+    if manifest is None or manifest.empty or (manifest['Source'] != source_version(path)).any():
+        manifest = write_partitions(path, cache_dir)
+    return manifest
+
+
+def load_partition(project_key, cache_dir=PARTITION_DIR):
+    """One project's preprocessed tickets"""
+    return pd.read_pickle(_partition_file(project_key, cache_dir))
@@ -0,0 +1,338 @@
+import argparse
+import html
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+
+import charts
+import metrics
+from data import find_data_file, read_export
+from teams import DEFAULT_MAPPING_FILE, TeamIndex, load_team_mapping
+
+# Every page loads plotly.js from one shared local copy at the output root
+PLOTLY_JS = "plotly.min.js"
+
+VIEWS = [
+    ('overview', "📊 Overview"),
+    ('individual', "👤 Individual Performance"),
+    ('trends', "📈 Trends & Analytics"),
+]
+
+PAGE_CSS = """
+body {
+    margin: 0;
+    padding: 32px;
+    background: linear-gradient(135deg, #0a0a0f 0%, #1a1a2e 50%, #16213e 100%);
+    color: #e2e8f0;
+    font-family: 'Inter', system-ui, -apple-system, 'Segoe UI', sans-serif;
+    min-height: 100vh;
+}
+a { color: #a3bffa; }
+h1 { color: #a3bffa; font-size: 2.2rem; margin-bottom: 0; }
+h2 { color: #e2e8f0; border-bottom: 1px solid rgba(255,255,255,0.1); padding-bottom: 8px; margin-top: 32px; }
+.sub-header { color: #a0aec0; margin-top: 4px; }
+nav a { margin-right: 16px; text-decoration: none; }
+nav a.active { color: #e2e8f0; font-weight: 600; }
+.cards { display: grid; grid-template-columns: repeat(auto-fit, minmax(160px, 1fr)); gap: 16px; }
+.metric-container {
+    background: linear-gradient(145deg, #1e1e2f 0%, #2d2d44 100%);
+    border-radius: 16px;
+    padding: 20px;
+    border: 1px solid rgba(255,255,255,0.1);
+}
+.metric-value { font-size: 2rem; font-weight: 700; color: #a3bffa; }
+.metric-label { color: #a0aec0; font-size: 0.85rem; text-transform: uppercase; letter-spacing: 1px; }
+.metric-delta { color: #a0aec0; font-size: 0.85rem; margin-top: 6px; }
+.grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(420px, 1fr)); gap: 16px; }
+table { border-collapse: collapse; width: 100%; }
+th, td { text-align: left; padding: 8px 12px; border-bottom: 1px solid rgba(255,255,255,0.06); }
+th { color: #a0aec0; font-weight: 500; }
+footer { text-align: center; color: #a0aec0; padding: 20px; font-size: 0.8rem; }
+"""
+
+# Per-member pages live here, next to the team / assignee directories
+PEOPLE_DIR = "people"
+
+# Dataset, member summaries and member page slugs shared with worker processes
+# (set once per worker by the pool initializer)
+_dataset = None
+_summaries = None
+_person_slugs = None
+
+
+def slugify(name):
+    return re.sub(r'[^a-z0-9]+', '-', str(name).lower()).strip('-') or 'unnamed'
+
+
+def unique_slug(slug, taken):
+    """`slug`, or `slug-2`, `slug-3`, ... if it is already in `taken` (which is updated)"""
+    candidate, n = slug, 1
+    while candidate in taken:
+        n += 1
+        candidate = f"{slug}-{n}"
+    taken.add(candidate)
+    return candidate
+
+
+def metric_card(label, value, delta=None):
+    delta_html = f'<div class="metric-delta">{html.escape(delta)}</div>' if delta else ""
+    return f"""
+    <div class="metric-container">
+        <div class="metric-label">{html.escape(label)}</div>
+        <div class="metric-value">{html.escape(str(value))}</div>
+        {delta_html}
+    </div>
+    """
+
+
+def figure_html(fig):
+    return fig.to_html(full_html=False, include_plotlyjs=False, config={'displaylogo': False})
+
+
+def table_html(df):
+    return df.to_html(index=False, border=0, escape=True)
+
+
+def page_html(title, view, body):
+    """Wrap a view body in a standalone page with navigation between views (none if `view` is None)"""
+    nav = " ".join(
+        f'<a href="{name}.html" class="{"active" if name == view else ""}">{label}</a>'
+        for name, label in VIEWS
+    ) if view else ""
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)} · Team Performance Dashboard</title>
+<script src="../{PLOTLY_JS}"></script>
+<style>{PAGE_CSS}</style>
+</head>
+<body>
+<h1>🚀 {html.escape(title)}</h1>
+<p class="sub-header">Static team report · <a href="../index.html">All reports</a></p>
+<nav>{nav}</nav>
+{body}
+<footer>Generated {datetime.now().strftime("%Y-%m-%d %H:%M")}</footer>
+</body>
+</html>
+"""
+
+
+# --- Views ---
+
+def overview_html(df):
+    kpi = metrics.kpis(df)
+    cards = "".join([
+        metric_card("Total Issues", kpi['total'], "📋 All tickets"),
+        metric_card("Completed", kpi['completed'], f"✅ {kpi['completion_rate']:.1f}% rate"),
+        metric_card("In Progress", kpi['in_progress'], "🔄 Active work"),
+        metric_card("To Do", kpi['todo'], "📝 Backlog"),
+        metric_card(
+            "Avg Resolution",
+            f"{kpi['avg_resolution']:.1f}d" if kpi['avg_resolution'] > 0 else "N/A",
+            "⏱️ Days to close"
+        ),
+    ])
+
+    leaderboard = metrics.leaderboard(df).head(5)
+    leaderboard.insert(0, 'Rank', range(1, len(leaderboard) + 1))
+
+    return f"""
+    <div class="cards">{cards}</div>
+    <div class="grid">
+        <div><h2>📊 Workload Distribution</h2>{figure_html(charts.workload_figure(metrics.workload(df)))}</div>
+        <div><h2>🏆 Team Leaderboard</h2>{table_html(leaderboard)}</div>
+    </div>
+    <div class="grid">
+        <div><h2>📌 Status Distribution</h2>{figure_html(charts.status_figure(metrics.distribution(df, 'Status')))}</div>
+        <div><h2>⚡ Priority Breakdown</h2>{figure_html(charts.priority_figure(metrics.distribution(df, 'Priority')))}</div>
+        <div><h2>🏷️ Issue Types</h2>{figure_html(charts.issue_type_figure(metrics.distribution(df, 'Issue Type', 'Type')))}</div>
+    </div>
+    """
+
+
+def person_html(person, person_df, summary):
+    """One member's section; `summary` is their row of metrics.person_summaries"""
+    cards = "".join([
+        metric_card("Total Assigned", summary['total']),
+        metric_card("Completed", summary['done'], f"{summary['efficiency']:.0f}% efficiency"),
+        metric_card("In Progress", summary['in_progress']),
+        metric_card(
+            "Avg Resolution",
+            f"{summary['avg_resolution']:.1f} days" if summary['avg_resolution'] > 0 else "N/A"
+        ),
+        metric_card("Team Rank", f"#{summary['rank']}"),
+    ])
+    recent = person_df[['Issue key', 'Summary', 'Status', 'Priority', 'Created']]
+    return f"""
+    <h2>📊 {html.escape(person)}'s Performance</h2>
+    <div class="cards">{cards}</div>
+    <div class="grid">
+        <div>{figure_html(charts.person_status_figure(metrics.distribution(person_df, 'Status')))}</div>
+        <div>{figure_html(charts.timeline_figure(metrics.person_timeline(person_df)))}</div>
+    </div>
+    <h3>📋 Recent Tickets</h3>
+    {table_html(recent.sort_values('Created', ascending=False).head(10))}
+    """
+
+
+def individual_html(members):
+    """Members table linking to each person's page; like the app, stats use the full dataset"""
+    rows = _summaries.reindex(members).dropna(subset=['total'])
+    if rows.empty:
+        return "<p>No tickets assigned.</p>"
+    table = pd.DataFrame({
+        'Member': [
+            f'<a href="../{PEOPLE_DIR}/{_person_slugs[person]}.html">{html.escape(person)}</a>'
+            for person in rows.index
+        ],
+        'Assigned': rows['total'].astype(int),
+        'Completed': rows['done'].astype(int),
+        'In Progress': rows['in_progress'].astype(int),
+        'Efficiency': rows['efficiency'].map(lambda value: f"{value:.0f}%"),
+        'Avg Resolution': rows['avg_resolution'].map(lambda value: f"{value:.1f} days" if value > 0 else "N/A"),
+        'Team Rank': rows['rank'].map(lambda rank: f"#{rank}"),
+    })
+    return f"<h2>👤 Team Members</h2>{table.to_html(index=False, border=0, escape=False)}"
+
+
+def trends_html(df):
+    resolution_data = metrics.resolution_days(df)
+    resolution = (
+        figure_html(charts.resolution_figure(resolution_data))
+        if not resolution_data.empty else "<p>No resolution time data available</p>"
+    )
+    return f"""
+    <div class="grid">
+        <div><h2>📅 Weekly Activity Trend</h2>{figure_html(charts.weekly_figure(metrics.weekly_trend(df)))}</div>
+        <div><h2>⏱️ Resolution Time Distribution</h2>{resolution}</div>
+    </div>
+    <h2>🗓️ Activity Heatmap by Day</h2>
+    {figure_html(charts.heatmap_figure(metrics.activity_heatmap(df)))}
+    <h2>👤 Reporter Analysis (Who Creates Most Tickets)</h2>
+    {figure_html(charts.reporter_figure(metrics.top_reporters(df)))}
+    """
+
+
+# --- Batch rendering ---
+
+def _init_worker(df, summaries, person_slugs):
+    global _dataset, _summaries, _person_slugs
+    _dataset, _summaries, _person_slugs = df, summaries, person_slugs
+
+
+def render_person(person, positions, out_dir):
+    """Write one member's page; runs in a worker process"""
+    body = person_html(person, _dataset.iloc[positions], _summaries.loc[person])
+    with open(os.path.join(out_dir, PEOPLE_DIR, f"{_person_slugs[person]}.html"), "w", encoding="utf-8") as f:
+        f.write(page_html(person, None, body))
+    return person
+
+
+def render_target(slug, title, positions, members, out_dir):
+    """Write the three views for one team / assignee; runs in a worker process"""
+    target_df = _dataset.iloc[positions]
+    target_dir = os.path.join(out_dir, slug)
+    os.makedirs(target_dir, exist_ok=True)
+
+    pages = {
+        'overview': lambda: overview_html(target_df),
+        'individual': lambda: individual_html(members),
+        'trends': lambda: trends_html(target_df),
+    }
+    for view, build in pages.items():
+        body = build() if not target_df.empty else "<p>No tickets.</p>"
+        with open(os.path.join(target_dir, f"{view}.html"), "w", encoding="utf-8") as f:
+            f.write(page_html(title, view, body))
+    return slug, title, len(target_df)
+
+
+def report_targets(index, by):
+    """(slug, title, row positions, members) for every team node or assignee"""
+    taken = set()
+    if by == 'assignee':
+        return [
+            (unique_slug(f"assignee-{slugify(person)}", taken), person, index.positions((), [person]), [person])
+            for person in index.members()
+        ]
+    return [
+        (
+            unique_slug("team-" + "--".join(slugify(part) for part in path) if path else "all", taken),
+            " / ".join(path) if path else "All Teams",
+            index.positions(path),
+            index.members(path)
+        )
+        for path in index.nodes()
+    ]
+
+
+def render_all(path, out_dir="reports", by='team', workers=None, mapping_file=DEFAULT_MAPPING_FILE):
+    """Load the dataset once and render every target's views over a process pool"""
+    from plotly.offline import get_plotlyjs
+
+    data_file = find_data_file(path)
+    if data_file is None:
+        raise FileNotFoundError(f"Jira export not found: {path}")
+    df = read_export(data_file)
+    index = TeamIndex(df, load_team_mapping(mapping_file))
+    targets = report_targets(index, by)
+
+    # Every member's stats and page are built once; team pages link to them
+    summaries = metrics.person_summaries(df)
+    taken = set()
+    person_slugs = {person: unique_slug(slugify(person), taken) for person in index.members()}
+
+    os.makedirs(os.path.join(out_dir, PEOPLE_DIR), exist_ok=True)
+    with open(os.path.join(out_dir, PLOTLY_JS), "w", encoding="utf-8") as f:
+        f.write(get_plotlyjs())
+
+    initargs = (df, summaries, person_slugs)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+        people = [
+            pool.submit(render_person, person, index.positions((), [person]), out_dir)
+            for person in person_slugs
+        ]
+        futures = [
+            pool.submit(render_target, slug, title, positions, members, out_dir)
+            for slug, title, positions, members in targets
+        ]
+        for future in people:
+            future.result()
+        rendered = [future.result() for future in futures]
+
+    links = "".join(
+        f'<li><a href="{slug}/overview.html">{html.escape(title)}</a> · {count} tickets</li>'
+        for slug, title, count in rendered
+    )
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(f"""<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>Team Reports</title><style>{PAGE_CSS}</style></head>
+<body>
+<h1>🚀 Team Reports</h1>
+<p class="sub-header">Generated {datetime.now().strftime("%Y-%m-%d %H:%M")} from {html.escape(os.path.basename(data_file))}</p>
+<ul>{links}</ul>
+</body>
+</html>
+""")
+    return rendered
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render static HTML dashboard reports per team or assignee")
+    parser.add_argument("--data", default="Jira.csv", help="Jira CSV export")
+    parser.add_argument("--out", default="reports", help="Output directory")
+    parser.add_argument("--by", choices=['team', 'assignee'], default='team', help="One report per team node or per assignee")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--teams", default=DEFAULT_MAPPING_FILE, help="Optional Team,Assignee mapping file")
+    args = parser.parse_args(argv)
+
+    rendered = render_all(args.data, args.out, args.by, args.workers, args.teams)
+    print(f"Rendered {len(rendered)} reports into {args.out}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,7 @@
 #!/bin/bash
 source venv/bin/activate
+# --fast: precompile the dataset and bytecode so the first request starts warm
+if [ "$1" == "--fast" ]; then
+    python fast_start.py
+fi
 streamlit run app.py
@@ -0,0 +1,146 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# Columns Jira repeats once per value (pandas mangles them to "Watchers.1", ...)
+MULTI_VALUED_FIELDS = ['Watchers', 'Watchers Id', 'Comment']
+
+# (name column, account id column) pairs used to resolve people
+PERSON_COLUMNS = [
+    ('Assignee', 'Assignee Id'),
+    ('Reporter', 'Reporter Id'),
+    ('Creator', 'Creator Id'),
+]
+
+COMMENT_DATE_FORMAT = '%d/%b/%y %I:%M %p'
+
+
+def repeated_columns(columns, field):
+    """Return every (possibly mangled) copy of a repeated column, in file order"""
+    pattern = re.compile(re.escape(field) + r'(\.\d+)?')
+    return [c for c in columns if pattern.fullmatch(c)]
+
+
+def is_multi_valued(column):
+    """True for any copy of a multi-valued field"""
+    return any(repeated_columns([column], field) for field in MULTI_VALUED_FIELDS)
+
+
+def _stack(df, columns):
+    """Melt repeated columns into (row position, slot, value) long form"""
+    if not columns:
+        return pd.DataFrame({'row': [], 'slot': [], 'value': []})
+    values = df[columns].to_numpy(dtype=object)
+    rows, slots = np.nonzero(pd.notna(values))
+    return pd.DataFrame({
+        'row': rows,
+        'slot': slots,
+        'value': values[rows, slots]
+    })
+
+
+def read_side_tables(path):
+    """Parse Watchers / Comment columns into normalized integer-keyed tables
+
+    Returns a dict with:
+      people   - person_id -> account id / display name
+      watchers - ticket_id -> person_id
+      comments - ticket_id -> person_id (author), created
+    """
+    person_cols = [c for pair in PERSON_COLUMNS for c in pair]
+    raw = pd.read_csv(
+        path,
+        usecols=lambda c: c == 'Issue id' or c in person_cols or is_multi_valued(c)
+    )
+    ticket_ids = raw['Issue id'].to_numpy(dtype=np.int64)
+
+    # Watchers: names and ids sit in parallel columns, matched by position
+    watcher_names = _stack(raw, repeated_columns(raw.columns, 'Watchers'))
+    watcher_ids = _stack(raw, repeated_columns(raw.columns, 'Watchers Id'))
+    watchers = watcher_names.merge(
+        watcher_ids, on=['row', 'slot'], how='outer', suffixes=('_name', '_id')
+    )
+    watchers['account'] = watchers['value_id'].fillna(watchers['value_name'])
+
+    # Comments: "<date>;<author account id>;<body>"
+    comment_cells = _stack(raw, repeated_columns(raw.columns, 'Comment'))
+    parts = comment_cells['value'].astype(str).str.split(';', n=2, expand=True)
+    comments = pd.DataFrame({
+        'row': comment_cells['row'],
+        'account': parts[1] if 1 in parts else pd.Series(dtype=object),
+        'created': pd.to_datetime(
+            parts[0] if 0 in parts else pd.Series(dtype=object),
+            format=COMMENT_DATE_FORMAT,
+            errors='coerce'
+        )
+    })
+
+    # People dimension: account id -> first known display name
+    known = [
+        raw[[id_col, name_col]].set_axis(['account', 'name'], axis=1)
+        for name_col, id_col in PERSON_COLUMNS
+        if name_col in raw.columns and id_col in raw.columns
+    ]
+    known.append(watchers[['account', 'value_name']].rename(columns={'value_name': 'name'}))
+    names = pd.concat(known).dropna(subset=['account']).drop_duplicates('account')
+    names = names.set_index('account')['name']
+
+    accounts = pd.Index(pd.concat([watchers['account'], comments['account']]).dropna().unique())
+    people = pd.DataFrame({
+        'person_id': np.arange(len(accounts), dtype=np.int32),
+        'account': accounts,
+        'name': names.reindex(accounts).fillna(pd.Series(accounts, index=accounts)).to_numpy()
+    })
+
+    watchers = pd.DataFrame({
+        'ticket_id': ticket_ids[watchers['row'].to_numpy(dtype=np.intp)],
+        'person_id': accounts.get_indexer(watchers['account']).astype(np.int32)
+    }).drop_duplicates(ignore_index=True)
+
+    comments = comments.dropna(subset=['account'])
+    comments = pd.DataFrame({
+        'ticket_id': ticket_ids[comments['row'].to_numpy(dtype=np.intp)],
+        'person_id': accounts.get_indexer(comments['account']).astype(np.int32),
+        'created': comments['created'].to_numpy()
+    })
+
+    return {'people': people, 'watchers': watchers, 'comments': comments}
+
+
+def watcher_load(side, df):
+    """Watchers on each assignee's tickets, and tickets each assignee watches"""
+    owners = df[['Issue id', 'Assignee']].rename(columns={'Issue id': 'ticket_id'})
+    watched = side['watchers'].merge(owners, on='ticket_id', how='inner')
+
+    load = owners.groupby('Assignee').size().rename('Tickets').to_frame()
+    load['Watchers'] = watched.groupby('Assignee').size()
+    load['Watchers'] = load['Watchers'].fillna(0).astype(int)
+    load['Avg Watchers'] = (load['Watchers'] / load['Tickets']).round(2)
+
+    # Tickets (within the current view) each person is watching
+    names = side['people'].set_index('person_id')['name']
+    watching = watched.groupby('person_id').size()
+    watching.index = names.reindex(watching.index).to_numpy()
+    load['Watching'] = watching.groupby(level=0).sum().reindex(load.index).fillna(0).astype(int)
+
+    return load.reset_index()
+
+
+def comment_activity(side, df):
+    """Comments received on each assignee's tickets and comments they wrote"""
+    owners = df[['Issue id', 'Assignee']].rename(columns={'Issue id': 'ticket_id'})
+    comments = side['comments'].merge(owners, on='ticket_id', how='inner')
+
+    activity = owners.groupby('Assignee').size().rename('Tickets').to_frame()
+    activity['Comments Received'] = comments.groupby('Assignee').size()
+    activity['Comments Received'] = activity['Comments Received'].fillna(0).astype(int)
+
+    names = side['people'].set_index('person_id')['name']
+    authored = comments.groupby('person_id').agg(Written=('ticket_id', 'size'), Last=('created', 'max'))
+    authored.index = names.reindex(authored.index).to_numpy()
+    authored = authored.groupby(level=0).agg({'Written': 'sum', 'Last': 'max'})
+    activity['Comments Written'] = authored['Written'].reindex(activity.index).fillna(0).astype(int)
+    activity['Last Comment'] = authored['Last'].reindex(activity.index)
+
+    return activity.drop(columns='Tickets').reset_index()
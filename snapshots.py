@@ -0,0 +1,181 @@
+import os
+
+import pandas as pd
+
+# Fields whose changes are recorded between exports
+TRACKED_FIELDS = ['Status', 'Assignee', 'Priority']
+
+DEFAULT_STORE_DIR = "snapshots"
+
+# Only empty cells are missing: names like "NA" or "None" are real values
+CSV_OPTIONS = dict(keep_default_na=False, na_values=[''], dtype={field: object for field in TRACKED_FIELDS})
+
+
+class SnapshotStore:
+    """Delta-encoded history of Jira exports, keyed by Issue id
+
+    Every recorded export only stores the tickets whose tracked fields changed
+    since the previous snapshot (plus tombstones for tickets that disappeared),
+    so storage grows with the number of changes rather than tickets x days.
+    """
+
+    def __init__(self, directory=DEFAULT_STORE_DIR):
+        self.directory = directory
+        self.deltas_path = os.path.join(directory, "deltas.csv")
+        self.days_path = os.path.join(directory, "snapshots.csv")
+        self._deltas = None
+        self._days = None
+
+    # --- storage ---
+
+    def deltas(self):
+        """All recorded changes, ordered by snapshot day"""
+        if self._deltas is None:
+            if os.path.exists(self.deltas_path):
+                deltas = pd.read_csv(self.deltas_path, parse_dates=['Day'], **CSV_OPTIONS)
+            else:
+                deltas = pd.DataFrame(columns=['Day', 'Issue id', *TRACKED_FIELDS, 'Removed'])
+            self._deltas = deltas.astype({'Issue id': 'int64', 'Removed': 'bool'})
+        return self._deltas
+
+    def days(self):
+        """One row per recorded snapshot: Day, Tickets, Changes"""
+        if self._days is None:
+            if os.path.exists(self.days_path):
+                self._days = pd.read_csv(self.days_path, parse_dates=['Day'])
+            else:
+                self._days = pd.DataFrame(columns=['Day', 'Tickets', 'Changes'])
+        return self._days
+
+    def _save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._deltas.to_csv(self.deltas_path, index=False, date_format='%Y-%m-%d')
+        self._days.to_csv(self.days_path, index=False, date_format='%Y-%m-%d')
+
+    def record(self, df, day):
+        """Record an export as of `day`; returns the number of changed tickets
+
+        Re-recording the latest day replaces it. Recording a day older than the
+        latest snapshot is rejected, since later deltas depend on it.
+        """
+        day = pd.Timestamp(day).normalize()
+        deltas, days = self.deltas(), self.days()
+
+        if not days.empty and day < days['Day'].max():
+            raise ValueError(f"Snapshot for {day.date()} is older than the latest recorded snapshot")
+
+        deltas = deltas[deltas['Day'] < day]
+        days = days[days['Day'] < day]
+
+        current = (
+            df.drop_duplicates('Issue id', keep='last')
+            .set_index('Issue id')[TRACKED_FIELDS]
+            .astype(object)
+        )
+        previous = self._state(deltas)
+
+        # Tickets that are new or whose tracked fields differ
+        common = current.index.intersection(previous.index)
+        differs = (current.loc[common] != previous.loc[common]).any(axis=1)
+        changed = current.index.difference(previous.index).union(common[differs.to_numpy()])
+
+        changes = current.loc[changed].reset_index()
+        changes['Removed'] = False
+
+        # Tombstones for tickets that are no longer in the export
+        gone = previous.index.difference(current.index)
+        tombstones = previous.loc[gone].reset_index()
+        tombstones['Removed'] = True
+
+        new_rows = pd.concat([changes, tombstones], ignore_index=True)
+        new_rows.insert(0, 'Day', day)
+
+        frames = [frame for frame in (deltas, new_rows) if not frame.empty]
+        self._deltas = (
+            pd.concat(frames, ignore_index=True) if frames else new_rows
+        ).astype({'Issue id': 'int64', 'Removed': 'bool'})
+        summary = pd.DataFrame({'Day': [day], 'Tickets': [len(current)], 'Changes': [len(new_rows)]})
+        self._days = pd.concat([frame for frame in (days, summary) if not frame.empty], ignore_index=True)
+        self._save()
+
+        return len(new_rows)
+
+    # --- reconstruction ---
+
+    @staticmethod
+    def _state(deltas):
+        """Latest tracked fields per live ticket from a slice of deltas"""
+        latest = deltas.drop_duplicates('Issue id', keep='last')
+        latest = latest[~latest['Removed']]
+        return latest.set_index('Issue id')[TRACKED_FIELDS].astype(object)
+
+    def state_at(self, day):
+        """Reconstruct Status / Assignee / Priority for every ticket as of `day`"""
+        deltas = self.deltas()
+        return self._state(deltas[deltas['Day'] <= pd.Timestamp(day)])
+
+    def _series(self, key, counted):
+        """Count tickets per key value over time from per-delta key / flag series
+
+        Each delta adds one to its new key (if counted) and removes one from the
+        ticket's previous key (if that was counted), so the cumulative sum over
+        days gives the count at every snapshot in a single pass.
+        """
+        deltas = self.deltas()
+        days = pd.DatetimeIndex(self.days()['Day'])
+        if deltas.empty:
+            return pd.DataFrame(index=days)
+
+        prev_key = key.groupby(deltas['Issue id'], sort=False).shift()
+        prev_counted = counted.groupby(deltas['Issue id'], sort=False).shift()
+        prev_counted = prev_counted.fillna(False).astype(bool)
+
+        adds = pd.DataFrame({'Day': deltas['Day'], 'Key': key, 'Delta': 1})[counted.to_numpy()]
+        drops = pd.DataFrame({'Day': deltas['Day'], 'Key': prev_key, 'Delta': -1})[prev_counted.to_numpy()]
+
+        moves = pd.concat([adds, drops], ignore_index=True)
+        if moves.empty:
+            return pd.DataFrame(index=days)
+        series = moves.pivot_table(index='Day', columns='Key', values='Delta', aggfunc='sum', fill_value=0)
+        series = series.reindex(days, fill_value=0).cumsum()
+        series.index.name = 'Day'
+        series.columns.name = None
+        return series.astype(int)
+
+    def backlog_series(self, groups=None):
+        """Ticket counts per Status (or per status group label) at each snapshot
+
+        `groups` optionally maps status -> label (e.g. 'In Review' -> 'In Progress');
+        unmapped statuses keep their own name.
+        """
+        deltas = self.deltas()
+        status = deltas['Status']
+        if groups:
+            status = status.map(groups).fillna(status)
+        return self._series(status, ~deltas['Removed'])
+
+    def open_load_series(self, done_statuses):
+        """Open (not done) tickets per assignee at each snapshot"""
+        deltas = self.deltas()
+        counted = ~deltas['Removed'] & ~deltas['Status'].isin(done_statuses)
+        return self._series(deltas['Assignee'], counted)
+
+
+def combine_series(frames):
+    """Sum per-snapshot series from several stores (e.g. one per project)
+
+    Stores may have snapshots on different days; each one carries its last
+    known counts forward until its next snapshot.
+    """
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame()
+    days = frames[0].index
+    for frame in frames[1:]:
+        days = days.union(frame.index)
+    combined = frames[0].reindex(days).ffill().fillna(0)
+    for frame in frames[1:]:
+        combined = combined.add(frame.reindex(days).ffill().fillna(0), fill_value=0)
+    combined = combined.reindex(columns=sorted(combined.columns)).fillna(0)
+    combined.index.name = 'Day'
+    return combined.astype(int)
@@ -0,0 +1,107 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+TEAM_COLUMN = 'Custom field (Team)'
+
+# Optional local mapping (columns: Team, Assignee); overrides the Jira team field
+DEFAULT_MAPPING_FILE = "teams.csv"
+
+# Nested teams are written as paths, e.g. "Engineering/Platform/Search"
+TEAM_SEPARATOR = '/'
+NO_TEAM = 'No Team'
+
+# Most members sent to the browser in one picker; larger teams list their busiest
+MAX_MEMBER_OPTIONS = 100
+
+
+def load_team_mapping(path=DEFAULT_MAPPING_FILE):
+    """Read the Assignee -> Team mapping file, or None if there isn't one"""
+    if not path or not os.path.exists(path):
+        return None
+    mapping = pd.read_csv(path, usecols=['Team', 'Assignee']).dropna()
+    return mapping.drop_duplicates('Assignee', keep='last').set_index('Assignee')['Team']
+
+
+def _split(team):
+    return tuple(part.strip() for part in str(team).split(TEAM_SEPARATOR) if part.strip()) or (NO_TEAM,)
+
+
+class TeamIndex:
+    """Precomputed team -> member / row index over one dataset
+
+    Every node of the team hierarchy (a tuple path, () being the whole org)
+    maps to the sorted row positions under it and the assignee codes that
+    appear there, so resolving a selection never scans assignee names.
+    """
+
+    def __init__(self, df, mapping=None):
+        assignees = pd.Categorical(df['Assignee'])
+        self.names = assignees.categories
+        self.codes = assignees.codes.astype(np.int32)
+        self.size = len(df)
+
+        # Team per row: local mapping first, then the Jira team field
+        teams = pd.Series(NO_TEAM, index=df.index, dtype=object)
+        if TEAM_COLUMN in df.columns:
+            teams = df[TEAM_COLUMN].fillna(NO_TEAM).astype(object)
+        if mapping is not None:
+            mapped = df['Assignee'].map(mapping)
+            teams = mapped.where(mapped.notna(), teams)
+
+        self._rows = {}
+        self._children = {}
+        for team, positions in teams.groupby(teams.to_numpy(), sort=True).indices.items():
+            path = _split(team)
+            for depth in range(len(path) + 1):
+                node = path[:depth]
+                self._rows.setdefault(node, []).append(positions)
+                if depth < len(path):
+                    self._children.setdefault(node, set()).add(path[depth])
+        self._rows.setdefault((), [])
+
+        self._rows = {
+            node: np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.intp)
+            for node, parts in self._rows.items()
+        }
+        self._members = {node: np.unique(self.codes[rows]) for node, rows in self._rows.items()}
+
+    def children(self, path=()):
+        """Sub-teams directly under `path` (only this level is ever sent to the browser)"""
+        return sorted(self._children.get(tuple(path), ()))
+
+    def members(self, path=(), limit=None):
+        """Assignee names that have tickets under `path`
+
+        With `limit`, only the `limit` members with the most tickets there are
+        returned (still sorted by name).
+        """
+        codes = self._members.get(tuple(path), np.empty(0, dtype=np.int32))
+        if limit is not None and len(codes) > limit:
+            counts = np.bincount(self.codes[self._rows[tuple(path)]], minlength=len(self.names))[codes]
+            codes = np.sort(codes[np.argsort(-counts, kind='stable')[:limit]])
+        return self.names[codes].tolist()
+
+    def member_count(self, path=()):
+        """Number of assignees with tickets under `path`"""
+        return len(self._members.get(tuple(path), ()))
+
+    def nodes(self):
+        """Every team path in the hierarchy, parents before children"""
+        return sorted(self._rows, key=lambda node: (len(node), node))
+
+    def positions(self, path=(), members=None):
+        """Sorted row positions for a team, optionally narrowed to some of its members"""
+        rows = self._rows.get(tuple(path), np.empty(0, dtype=np.intp))
+        if members:
+            wanted = self.names.get_indexer(members)
+            rows = rows[np.isin(self.codes[rows], wanted[wanted >= 0])]
+        return rows
+
+    def rows(self, path=(), members=None):
+        """Boolean row mask for a team, optionally narrowed to some of its members"""
+        rows = self.positions(path, members)
+        mask = np.zeros(self.size, dtype=bool)
+        mask[rows] = True
+        return mask